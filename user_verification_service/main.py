@@ -1,7 +1,10 @@
+import asyncio
+import sys
 from contextlib import asynccontextmanager
 
 import uvicorn
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 from starlette.middleware.cors import CORSMiddleware
 from user_verification_service.src.api.middleware.error_handler import (
     ErrorHandlerMiddleware,
@@ -13,8 +16,8 @@ from user_verification_service.src.api.routes.health import router as health_rou
 from user_verification_service.src.api.routes.verification import (
     router as verification_router,
 )
-from user_verification_service.src.core.config import Settings
-from user_verification_service.src.core.logger import Logger
+from user_verification_service.src.core.config import get_settings
+from user_verification_service.src.core.logger import get_logger
 from user_verification_service.src.infrastructure.database.connection import (
     DatabaseConnection,
 )
@@ -25,32 +28,46 @@ from user_verification_service.src.infrastructure.database.startup import (
 from user_verification_service.src.infrastructure.kafka.producer import (
     KafkaEventPublisher,
 )
+from user_verification_service.src.services.verification_service import (
+    VerificationService,
+)
 
-settings = Settings()
-logger = Logger()
+settings = get_settings()
+logger = get_logger()
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Application lifespan manager."""
     logger.info("Starting User Verification Service")
-    await create_database_tables()
+    if sys.version_info >= (3, 12):
+        # Run new tasks eagerly until their first suspension point
+        asyncio.get_running_loop().set_task_factory(asyncio.eager_task_factory)
+
+    db_connection = DatabaseConnection(settings)
+    await create_database_tables(db_connection)
 
     kafka_publisher = KafkaEventPublisher(settings, logger)
     await kafka_publisher.get_producer()
 
-    db_connection = DatabaseConnection(settings)
-
-    await perform_startup_checks()
+    await perform_startup_checks(db_connection)
 
     app.state.kafka_publisher = kafka_publisher
     app.state.db_connection = db_connection
+    # One service per worker so max_concurrent_verifications is enforced across requests
+    app.state.verification_service = VerificationService(
+        repository=None,
+        event_publisher=kafka_publisher,
+        settings=settings,
+        logger=logger
+    )
 
     yield
 
     logger.info("Shutting down User Verification Service")
 
-    await app.state.kafka_publisher.xclose()
+    await app.state.verification_service.wait_for_publishes()
+    await app.state.kafka_publisher.close()
     await app.state.db_connection.engine.dispose()
 
 
@@ -60,6 +77,7 @@ def create_application() -> FastAPI:
         title="User Verification Service",
         version="1.0.0",
         lifespan=lifespan,
+        default_response_class=ORJSONResponse,
         docs_url="/api/docs",
         redoc_url="/api/redoc",
         openapi_url="/api/openapi.json"
@@ -67,11 +85,12 @@ def create_application() -> FastAPI:
 
     app.add_middleware(ErrorHandlerMiddleware)
     app.add_middleware(RequestLoggerMiddleware)
+    # Added last so it is outermost and preflight requests skip logging and error handling
     app.add_middleware(
         CORSMiddleware,
-        allow_origins=["*"],
-        allow_methods=["*"],
-        allow_headers=["*"]
+        allow_origins=settings.cors_allowed_origins,
+        allow_methods=["GET", "POST"],
+        allow_headers=["X-Request-ID", "Content-Type"]
     )
     app.include_router(verification_router)
     app.include_router(health_router)
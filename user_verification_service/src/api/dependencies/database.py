@@ -3,14 +3,9 @@ from collections.abc import AsyncGenerator
 from fastapi import Depends
 from sqlalchemy.ext.asyncio import AsyncSession
 from starlette.requests import Request
-from user_verification_service.src.core.config import Settings
-from user_verification_service.src.core.logger import Logger
 from user_verification_service.src.infrastructure.repositories.verification_repository import VerificationRepository
 from user_verification_service.src.services.verification_service import VerificationService
 
-settings = Settings()
-logger = Logger()
-
 
 async def get_db_session(request: Request) -> AsyncGenerator[AsyncSession, None]:
     """Provide database session for request"""
@@ -18,11 +13,9 @@ async def get_db_session(request: Request) -> AsyncGenerator[AsyncSession, None]
         yield session
 
 
-async def get_verification_service(session: AsyncSession = Depends(get_db_session), request: Request = None) -> VerificationService:
-    """Provide configured verification service"""
-    return VerificationService(
-        repository=VerificationRepository(session),
-        event_publisher=request.app.state.kafka_publisher,
-        settings=settings,
-        logger=logger
-    )
+async def get_verification_service(
+        request: Request,
+        session: AsyncSession = Depends(get_db_session)
+) -> VerificationService:
+    """Bind the application-wide verification service to the request session."""
+    return request.app.state.verification_service.with_repository(VerificationRepository(session))
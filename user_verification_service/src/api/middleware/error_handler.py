@@ -1,29 +1,58 @@
 import contextvars
 from uuid import uuid4
 
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.requests import Request
-from starlette.responses import JSONResponse
-from user_verification_service.src.core.logger import Logger
+import orjson
+from starlette.datastructures import MutableHeaders
+from starlette.responses import Response
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from user_verification_service.src.core.logger import get_logger
 
-logger = Logger()
+logger = get_logger()
 
 # Context variable for request ID
 request_id_var: contextvars.ContextVar[str] = contextvars.ContextVar("request_id")
 
 
-class ErrorHandlerMiddleware(BaseHTTPMiddleware):
-    async def dispatch(self, request: Request, call_next):
-        request_id = request.headers.get("X-Request-ID", str(uuid4()))
+def _get_request_id(scope: Scope) -> str:
+    """Read X-Request-ID from raw ASGI headers, generating one if absent."""
+    for name, value in scope["headers"]:
+        if name == b"x-request-id":
+            return value.decode("latin-1")
+    return str(uuid4())
+
+
+class ErrorHandlerMiddleware:
+    """Pure ASGI middleware attaching request IDs and converting unhandled errors to 500s."""
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        request_id = _get_request_id(scope)
         request_id_var.set(request_id)
+        response_started = False
+
+        async def send_with_request_id(message: Message) -> None:
+            nonlocal response_started
+            if message["type"] == "http.response.start":
+                response_started = True
+                MutableHeaders(scope=message).append("X-Request-ID", request_id)
+            await send(message)
 
         try:
-            response = await call_next(request)
-            response.headers["X-Request-ID"] = request_id
-            return response
+            await self.app(scope, receive, send_with_request_id)
         except Exception as e:
             logger.error(f"Unhandled exception: {e!s}", extra={"request_id": request_id}, exc_info=True)
-            return JSONResponse(
+            if response_started:
+                raise
+            response = Response(
+                content=orjson.dumps({"error": "Internal server error", "request_id": request_id}),
                 status_code=500,
-                content={"error": "Internal server error", "request_id": request_id}
+                headers={"X-Request-ID": request_id},
+                media_type="application/json"
             )
+            await response(scope, receive, send)
@@ -1,31 +1,54 @@
 import time
 
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.requests import Request
-from user_verification_service.src.core.logger import Logger
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from user_verification_service.src.core.logger import get_logger
 
-logger = Logger()
+logger = get_logger()
 
 
-class RequestLoggerMiddleware(BaseHTTPMiddleware):
-    async def dispatch(self, request: Request, call_next):
-        start_time = time.perf_counter()
+class RequestLoggerMiddleware:
+    """Pure ASGI middleware logging requests with their processing time."""
 
-        logger.info(f"Request started: {request.method} {request.url.path}", extra={
-            "method": request.method,
-            "path": request.url.path,
-            "client": request.client.host if request.client else None
-        })
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
 
-        response = await call_next(request)
-        duration = time.perf_counter() - start_time
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
 
-        logger.info(f"Request completed: {request.method} {request.url.path}", extra={
-            "method": request.method,
-            "path": request.url.path,
-            "status_code": response.status_code,
-            "duration_seconds": duration
+        start_time = time.perf_counter()
+        method = scope["method"]
+        path = scope["path"]
+        client = scope.get("client")
+        status_code = 500
+        duration = None
+
+        logger.info(f"Request started: {method} {path}", extra={
+            "method": method,
+            "path": path,
+            "client": client[0] if client else None
         })
 
-        response.headers["X-Process-Time"] = str(duration)
-        return response
+        async def send_with_process_time(message: Message) -> None:
+            nonlocal status_code, duration
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                MutableHeaders(scope=message).append("X-Process-Time", str(time.perf_counter() - start_time))
+            await send(message)
+            if message["type"] == "http.response.body" and not message.get("more_body", False):
+                # Background tasks run inside the app call after this, so stop the clock once the response is out
+                duration = time.perf_counter() - start_time
+
+        try:
+            await self.app(scope, receive, send_with_process_time)
+        finally:
+            if duration is None:
+                duration = time.perf_counter() - start_time
+            logger.info(f"Request completed: {method} {path}", extra={
+                "method": method,
+                "path": path,
+                "status_code": status_code,
+                "duration_seconds": duration
+            })
@@ -1,13 +1,14 @@
+import orjson
 from fastapi import APIRouter
-from starlette.responses import JSONResponse
+from fastapi.responses import Response
 
 router = APIRouter(tags=["health"])
 
+_HEALTH_BODY = orjson.dumps({"status": "healthy", "service": "user_verification_service"})
+
 
 @router.get("/health")
 async def health_check():
     """Health check endpoint"""
-    return JSONResponse(
-        status_code=200,
-        content={"status": "healthy", "service": "user_verification_service"}
-    )
+    # Response objects are not shared: middlewares append to their raw header list
+    return Response(content=_HEALTH_BODY, media_type="application/json")
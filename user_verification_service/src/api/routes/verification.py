@@ -1,19 +1,32 @@
-from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, status
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Request, status
 from user_verification_service.src.api.dependencies.database import get_verification_service
 from user_verification_service.src.api.middleware.error_handler import request_id_var
 from user_verification_service.src.core.exceptions import BaseServiceException
-from user_verification_service.src.core.logger import Logger
+from user_verification_service.src.core.logger import get_logger
+from user_verification_service.src.domain.models.verification import UserVerification, VerificationStatus
 from user_verification_service.src.domain.schemas.requests import VerificationRequest, VerificationResponse
+from user_verification_service.src.infrastructure.repositories.verification_repository import VerificationRepository
 from user_verification_service.src.services.verification_service import VerificationService
 
 router = APIRouter(tags=["verification"])
-logger = Logger()
+logger = get_logger()
+
+
+async def _complete_verification(http_request: Request, verification: UserVerification) -> None:
+    """Finish a pending verification in its own session once the response has been sent."""
+    try:
+        async with http_request.app.state.db_connection.get_session() as session:
+            service = http_request.app.state.verification_service.with_repository(VerificationRepository(session))
+            await service.complete_verification(verification)
+    except Exception:
+        logger.exception("Failed to complete verification %s", verification.id)
 
 
 @router.post("/verify", response_model=VerificationResponse, status_code=status.HTTP_202_ACCEPTED)
 async def verify_user(
     request: VerificationRequest,
     background_tasks: BackgroundTasks,
+    http_request: Request,
     service: VerificationService = Depends(get_verification_service),
 ) -> VerificationResponse:
     logger.info("Verification request received", extra={
@@ -29,6 +42,9 @@ async def verify_user(
             document_base64=request.document
         )
 
+        if verification.status == VerificationStatus.PENDING:
+            background_tasks.add_task(_complete_verification, http_request, verification)
+
         return VerificationResponse(
             message="Verification in progress",
             verification_id=str(verification.id),
@@ -1,5 +1,6 @@
 import logging
 import sys
+from functools import lru_cache
 from pathlib import Path
 
 
@@ -52,3 +53,9 @@ class Logger:
     def exception(self, msg, *args, **kwargs) -> None:
         """Log an exception message."""
         self._logger.exception(msg, *args, **kwargs)
+
+
+@lru_cache(maxsize=1)
+def get_logger() -> Logger:
+    """Return the process-wide Logger instance, configured once."""
+    return Logger()
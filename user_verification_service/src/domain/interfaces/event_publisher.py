@@ -1,13 +1,9 @@
-from abc import ABC, abstractmethod
+from typing import Protocol
 
 from user_verification_service.src.domain.schemas.events import UserVerifiedEvent
 
 
-class IEventPublisher(ABC):
-    @abstractmethod
-    async def publish(self, event: UserVerifiedEvent) -> None:
-        pass
+class IEventPublisher(Protocol):
+    async def publish(self, event: UserVerifiedEvent) -> None: ...
 
-    @abstractmethod
-    async def publish_batch(self, events: list[UserVerifiedEvent]) -> None:
-        pass
+    async def publish_batch(self, events: list[UserVerifiedEvent]) -> None: ...
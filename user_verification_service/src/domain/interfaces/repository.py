@@ -1,4 +1,4 @@
-from abc import ABC, abstractmethod
+from typing import Protocol
 from uuid import UUID
 
 from user_verification_service.src.domain.models.verification import (
@@ -7,15 +7,9 @@ from user_verification_service.src.domain.models.verification import (
 )
 
 
-class IVerificationRepository(ABC):
-    @abstractmethod
-    async def save(self, verification: UserVerification) -> UserVerification:
-        pass
+class IVerificationRepository(Protocol):
+    async def save(self, verification: UserVerification) -> UserVerification: ...
 
-    @abstractmethod
-    async def get_by_user_and_network(self, user_id: str, network: str) -> UserVerification | None:
-        pass
+    async def get_by_user_and_network(self, user_id: str, network: str) -> UserVerification | None: ...
 
-    @abstractmethod
-    async def update_status(self, verification_id: UUID, status: VerificationStatus) -> None:
-        pass
+    async def update_status(self, verification_id: UUID, status: VerificationStatus) -> None: ...
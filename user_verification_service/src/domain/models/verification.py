@@ -1,5 +1,5 @@
 from dataclasses import dataclass, field
-from datetime import datetime
+from datetime import UTC, datetime
 from enum import Enum
 from uuid import UUID
 
@@ -20,7 +20,7 @@ class NetworkType(str, Enum):
     BITCOIN = "bitcoin"
 
 
-@dataclass
+@dataclass(slots=True)
 class UserVerification:
     """Domain model for user verification"""
 
@@ -30,12 +30,12 @@ class UserVerification:
     id: UUID | None = None
     status: VerificationStatus = VerificationStatus.PENDING
     verified_at: datetime | None = None
-    created_at: datetime = field(default_factory=datetime.now)
+    created_at: datetime = field(default_factory=lambda: datetime.now(UTC))
 
     def verify(self):
         """Domain logic for verification"""
         self.status = VerificationStatus.VERIFIED
-        self.verified_at = datetime.now()
+        self.verified_at = datetime.now(UTC)
 
     def fail(self):
         """Domain logic for failed verification"""
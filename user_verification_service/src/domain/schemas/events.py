@@ -1,23 +1,33 @@
-from datetime import datetime
+from datetime import UTC, datetime
+from functools import cached_property
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
+
+_EVENT_TYPE_HEADER = ("event_type", b"user.verified")
 
 
 class UserVerifiedEvent(BaseModel):
     """User verified event."""
 
+    model_config = ConfigDict(frozen=True)
+
     event: str = "user.verified"
     user_id: str
     network: str
-    timestamp: datetime = Field(default_factory=datetime.now)
+    timestamp: datetime = Field(default_factory=lambda: datetime.now(UTC))
 
-    def to_kafka_message(self) -> dict:
-        """Convert event to kafka message."""
+    @cached_property
+    def kafka_message(self) -> dict:
+        """Kafka message for the event, serialized once since the event is frozen."""
         return {
-            "key": self.user_id.encode("utf-8"),
-            "value": self.model_dump_json().encode("utf-8"),
-            "headers": [
-                ("event_type", b"user.verified"),
-                ("timestamp", str(self.timestamp.timestamp()).encode())
-            ]
+            "key": self.user_id.encode(),
+            "value": _EVENT_ADAPTER.dump_json(self),
+            "headers": (
+                _EVENT_TYPE_HEADER,
+                ("timestamp", f"{self.timestamp.timestamp():.6f}".encode())
+            )
         }
+
+
+# Compiled once; dump_json serializes straight to bytes without an intermediate dict
+_EVENT_ADAPTER = TypeAdapter(UserVerifiedEvent)
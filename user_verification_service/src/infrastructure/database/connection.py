@@ -1,6 +1,7 @@
 from collections.abc import AsyncGenerator
 from contextlib import asynccontextmanager
 from typing import Any
+from uuid import uuid4
 
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from user_verification_service.src.core.config import Settings
@@ -10,6 +11,17 @@ class DatabaseConnection:
     """Connection manager with pooling."""
 
     def __init__(self, settings: Settings):
+        connect_args: dict[str, Any] = {
+            "server_settings": {"jit": "off", "application_name": settings.app_name},
+            "command_timeout": 60,
+        }
+        if settings.db_pgbouncer_transaction_pooling:
+            # Transaction pooling may hand each statement to a different server connection, so neither asyncpg
+            # nor SQLAlchemy's dialect may reuse prepared statements, and their names must not collide
+            connect_args["statement_cache_size"] = 0
+            connect_args["prepared_statement_cache_size"] = 0
+            connect_args["prepared_statement_name_func"] = lambda: f"__asyncpg_{uuid4()}__"
+
         self.engine = create_async_engine(
             settings.database_url,
             pool_size=settings.db_pool_size,
@@ -17,11 +29,7 @@ class DatabaseConnection:
             pool_pre_ping=settings.db_pool_pre_ping,
             echo=settings.db_echo,
             pool_recycle=3600,
-            connect_args={
-                "server_settings": {"jit": "off"},
-                "command_timeout": 60,
-                "prepared_statement_cache_size": 0,
-            }
+            connect_args=connect_args
         )
 
         self.async_session = async_sessionmaker(self.engine, class_=AsyncSession, expire_on_commit=False)
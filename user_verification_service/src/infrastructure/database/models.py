@@ -1,7 +1,7 @@
-from datetime import datetime
+from datetime import UTC, datetime
 from uuid import uuid4
 
-from sqlalchemy import Column, DateTime, Integer, String
+from sqlalchemy import Column, DateTime, Integer, String, UniqueConstraint
 from sqlalchemy.dialects.postgresql import UUID as PGUUID
 from sqlalchemy.ext.declarative import declarative_base
 
@@ -10,14 +10,15 @@ Base = declarative_base()
 
 class VerificationModel(Base):
     __tablename__ = "verifications"
+    __table_args__ = (UniqueConstraint("user_id", "network", name="uq_verifications_user_id_network"),)
 
     id = Column(PGUUID(as_uuid=True), primary_key=True, default=uuid4)
     user_id = Column(String, nullable=False, index=True)
     network = Column(String, nullable=False, index=True)
     document_hash = Column(String, nullable=False)
     status = Column(String, nullable=False, default="pending")
-    verified_at = Column(DateTime, nullable=True)
-    created_at = Column(DateTime, nullable=False, default=datetime.now)
+    verified_at = Column(DateTime(timezone=True), nullable=True)
+    created_at = Column(DateTime(timezone=True), nullable=False, default=lambda: datetime.now(UTC))
     version = Column(Integer, nullable=False, default=1)
 
     class Config:
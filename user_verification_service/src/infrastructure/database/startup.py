@@ -1,24 +1,55 @@
 from sqlalchemy import text
-from user_verification_service.src.core.config import Settings
 from user_verification_service.src.infrastructure.database.connection import (
     DatabaseConnection,
 )
 from user_verification_service.src.infrastructure.database.models import Base
 
+# create_all never alters an existing table, so tables created by older releases are upgraded in place.
+# Each statement is idempotent and runs on every startup.
+_SCHEMA_UPGRADES = (
+    # Timestamps used to be written as naive local time, which is UTC in the deployed containers
+    text("""
+        DO $$
+        BEGIN
+            IF EXISTS (
+                SELECT 1 FROM information_schema.columns
+                WHERE table_schema = current_schema()
+                  AND table_name = 'verifications'
+                  AND column_name = 'created_at'
+                  AND data_type = 'timestamp without time zone'
+            ) THEN
+                ALTER TABLE verifications
+                    ALTER COLUMN created_at TYPE TIMESTAMP WITH TIME ZONE USING created_at AT TIME ZONE 'UTC',
+                    ALTER COLUMN verified_at TYPE TIMESTAMP WITH TIME ZONE USING verified_at AT TIME ZONE 'UTC';
+            END IF;
+        END $$
+    """),
+    # The (user_id, network) upsert needs this constraint as its ON CONFLICT target
+    text("""
+        DO $$
+        BEGIN
+            IF NOT EXISTS (
+                SELECT 1 FROM pg_constraint
+                WHERE conname = 'uq_verifications_user_id_network'
+                  AND conrelid = 'verifications'::regclass
+            ) THEN
+                ALTER TABLE verifications
+                    ADD CONSTRAINT uq_verifications_user_id_network UNIQUE (user_id, network);
+            END IF;
+        END $$
+    """),
+)
 
-async def create_database_tables():
-    """Create database tables on startup"""
-    settings = Settings()
-    db_connection = DatabaseConnection(settings)
 
+async def create_database_tables(db_connection: DatabaseConnection):
+    """Create database tables on startup and upgrade ones created by older releases"""
     async with db_connection.engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
+        for statement in _SCHEMA_UPGRADES:
+            await conn.execute(statement)
 
 
-async def perform_startup_checks():
+async def perform_startup_checks(db_connection: DatabaseConnection):
     """Perform health checks on startup"""
-    settings = Settings()
-    db_connection = DatabaseConnection(settings)
-
     async with db_connection.get_session() as session:
         await session.execute(text("SELECT 1"))
@@ -1,19 +1,31 @@
 import asyncio
 
+import orjson
 from aiokafka import AIOKafkaProducer
+from aiokafka.partitioner import DefaultPartitioner
 from user_verification_service.src.core.config import Settings
 from user_verification_service.src.core.logger import Logger
-from user_verification_service.src.domain.interfaces.event_publisher import IEventPublisher
 from user_verification_service.src.domain.schemas.events import UserVerifiedEvent
 
 
-class KafkaEventPublisher(IEventPublisher):
+def _serialize_value(value: object) -> bytes:
+    """Pass pre-serialized payloads through untouched and encode anything else with orjson."""
+    if isinstance(value, bytes):
+        return value
+    if isinstance(value, str):
+        return value.encode()
+    return orjson.dumps(value)
+
+
+class KafkaEventPublisher:
     """Kafka event publisher."""
 
     def __init__(self, settings: Settings, logger: Logger):
         self.settings = settings
         self.logger = logger
         self._producer: AIOKafkaProducer | None = None
+        self._topic = settings.kafka_topic_user_verified
+        self._partitioner = DefaultPartitioner()
 
     async def get_producer(self) -> AIOKafkaProducer:
         """Get producer instance."""
@@ -21,33 +33,57 @@ class KafkaEventPublisher(IEventPublisher):
             self._producer = AIOKafkaProducer(
                 bootstrap_servers=self.settings.kafka_bootstrap_servers,
                 **self.settings.kafka_producer_config,
-                value_serializer=lambda v: v,
+                value_serializer=_serialize_value,
                 key_serializer=lambda k: k
             )
             await self._producer.start()
         return self._producer
 
     async def publish(self, event: UserVerifiedEvent) -> None:
-        """Publish single event with retry logic"""
+        """Publish single event, raising if the broker does not acknowledge it."""
         producer = await self.get_producer()
-        message = event.to_kafka_message()
+        message = event.kafka_message
 
         try:
-            await producer.send_and_wait(topic=self.settings.kafka_topic_user_verified, **message)
+            # send() only enqueues into the producer batch; awaiting the delivery future surfaces broker errors
+            delivery = await producer.send(topic=self._topic, **message)
+            await delivery
         except Exception as e:
             self.logger.error(f"Failed to publish event: {e}")
             # Implement retry logic or dead letter queue
             raise
 
     async def publish_batch(self, events: list[UserVerifiedEvent]) -> None:
-        """Batch publish for better performance."""
+        """Batch publish through per-partition producer batches for better performance."""
+        if not events:
+            return
+
         producer = await self.get_producer()
-        tasks = [
-            producer.send(topic=self.settings.kafka_topic_user_verified, **event.to_kafka_message())
-            for event in events
-        ]
+        topic = self._topic
+        create_batch = producer.create_batch
+        send_batch = producer.send_batch
+        partitions = sorted(await producer.partitions_for(topic))
+        batches = {}
+        deliveries = []
+
+        for event in events:
+            message = event.kafka_message
+            # Keep key-based partitioning so per-user ordering matches publish()
+            partition = self._partitioner(message["key"], partitions, partitions)
+            batch = batches.get(partition)
+            if batch is None:
+                batch = batches[partition] = create_batch()
+
+            if batch.append(timestamp=None, **message) is None:
+                # Batch is full: flush it and start a new one for this partition
+                deliveries.append(await send_batch(batch, topic, partition=partition))
+                batch = batches[partition] = create_batch()
+                batch.append(timestamp=None, **message)
+
+        for partition, batch in batches.items():
+            deliveries.append(await send_batch(batch, topic, partition=partition))
 
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+        results = await asyncio.gather(*deliveries, return_exceptions=True)
         failures = [r for r in results if isinstance(r, Exception)]
 
         if failures:
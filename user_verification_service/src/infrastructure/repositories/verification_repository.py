@@ -1,10 +1,8 @@
 from uuid import UUID
 
 from sqlalchemy import and_, select, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
-from user_verification_service.src.domain.interfaces.repository import (
-    IVerificationRepository,
-)
 from user_verification_service.src.domain.models.verification import (
     NetworkType,
     UserVerification,
@@ -15,15 +13,18 @@ from user_verification_service.src.infrastructure.database.models import (
 )
 
 
-class VerificationRepository(IVerificationRepository):
+class VerificationRepository:
     """Repository for user verification."""
 
     def __init__(self, session: AsyncSession) -> None:
         self.session = session
 
     async def save(self, verification: UserVerification) -> UserVerification:
-        """Save verification to database."""
-        db_verification = VerificationModel(
+        """Upsert verification by (user_id, network) in a single INSERT ... ON CONFLICT round-trip.
+
+        Rows that are already verified are left untouched and returned as stored.
+        """
+        stmt = pg_insert(VerificationModel).values(
             user_id=verification.user_id,
             network=verification.network.value,
             document_hash=verification.document_hash,
@@ -31,11 +32,23 @@ class VerificationRepository(IVerificationRepository):
             verified_at=verification.verified_at,
             created_at=verification.created_at
         )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[VerificationModel.user_id, VerificationModel.network],
+            set_={
+                "document_hash": stmt.excluded.document_hash,
+                "status": stmt.excluded.status,
+                "verified_at": stmt.excluded.verified_at
+            },
+            where=VerificationModel.status != VerificationStatus.VERIFIED.value
+        ).returning(VerificationModel)
 
-        self.session.add(db_verification)
-        await self.session.flush()
-        verification.id = db_verification.id
-        return verification
+        result = await self.session.execute(stmt)
+        db_verification = result.scalar_one_or_none()
+        if db_verification is None:
+            # Conflict guard skipped the update: the row is already verified
+            return await self.get_by_user_and_network(verification.user_id, verification.network.value)
+
+        return self._to_domain(db_verification)
 
     async def get_by_user_and_network(self, user_id: str, network: str) -> UserVerification | None:
         """Get verification by user and network."""
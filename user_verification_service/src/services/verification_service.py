@@ -1,48 +1,91 @@
 import asyncio
-import base64
+import binascii
+import copy
 import hashlib
 
 from user_verification_service.src.core.config import Settings
+from user_verification_service.src.core.exceptions import InvalidDocumentFormatException
 from user_verification_service.src.core.logger import Logger
 from user_verification_service.src.domain.interfaces.event_publisher import IEventPublisher
 from user_verification_service.src.domain.interfaces.repository import IVerificationRepository
-from user_verification_service.src.domain.models.verification import NetworkType, UserVerification, VerificationStatus
+from user_verification_service.src.domain.models.verification import NetworkType, UserVerification
 from user_verification_service.src.domain.schemas.events import UserVerifiedEvent
 
+try:
+    # SIMD-accelerated decoder; documents can be several megabytes of base64
+    from pybase64 import b64decode
+except ImportError:
+    def b64decode(s: str, validate: bool = False) -> bytes:
+        return binascii.a2b_base64(s, strict_mode=validate)
+
+
+def _decoded_size(document_base64: str) -> int:
+    """Size of the decoded document, exact for any input strict base64 decoding accepts."""
+    padding = 2 if document_base64.endswith("==") else 1 if document_base64.endswith("=") else 0
+    return len(document_base64) // 4 * 3 - padding
+
+
+def _decode_and_hash(document_base64: str, max_bytes: int) -> str:
+    """Decode a base64 document, enforce the size limit and return its SHA-256 hex digest."""
+    # Reject oversized documents before paying for the decode and the decoded buffer
+    if _decoded_size(document_base64) > max_bytes:
+        raise ValueError("Document too large")
+
+    try:
+        document_data = b64decode(document_base64, validate=True)
+    except binascii.Error as e:
+        raise InvalidDocumentFormatException from e
+
+    return hashlib.sha256(document_data, usedforsecurity=False).hexdigest()
+
 
 class VerificationService:
-    def __init__(self, repository: IVerificationRepository, event_publisher: IEventPublisher, settings: Settings, logger: Logger):
+    def __init__(self, repository: IVerificationRepository | None, event_publisher: IEventPublisher, settings: Settings, logger: Logger):
         self.repository = repository
         self.event_publisher = event_publisher
         self.settings = settings
         self.logger = logger
         self._semaphore = asyncio.Semaphore(settings.max_concurrent_verifications)
+        self._publish_tasks: set[asyncio.Task] = set()
+
+    def with_repository(self, repository: IVerificationRepository) -> "VerificationService":
+        """Bind a session-scoped repository, sharing the concurrency limit and publish tasks with this service."""
+        bound = copy.copy(self)
+        bound.repository = repository
+        return bound
 
     async def verify_user(self, user_id: str, network: str, document_base64: str) -> UserVerification:
         async with self._semaphore:
-            document_data = base64.b64decode(document_base64)
-
-            if len(document_data) > self.settings.max_document_size_mb * 1024 * 1024:
-                raise ValueError("Document too large")
-
-            existing = await self.repository.get_by_user_and_network(user_id, network)
-            if existing and existing.status == VerificationStatus.VERIFIED:
-                return existing
+            # Decoding and hashing up to max_document_size_mb would otherwise stall the event loop
+            document_hash = await asyncio.to_thread(
+                _decode_and_hash, document_base64, self.settings.max_document_size_mb * 1024 * 1024
+            )
 
+            # The repository upserts on (user_id, network) and returns an already verified row unchanged
             verification = UserVerification(
                 user_id=user_id,
                 network=NetworkType(network),
-                document_hash=hashlib.sha256(document_data).hexdigest()
+                document_hash=document_hash
             )
 
-            verification = await self.repository.save(verification)
-            await asyncio.sleep(self.settings.verification_delay_seconds)
+            return await self.repository.save(verification)
+
+    async def complete_verification(self, verification: UserVerification) -> UserVerification:
+        """Finish a pending verification outside the request path."""
+        await asyncio.sleep(self.settings.verification_delay_seconds)
+
+        verification.verify()
+        await self.repository.update_status(verification.id, verification.status)
 
-            verification.verify()
-            await self.repository.update_status(verification.id, verification.status)
+        # Keep a strong reference so the publish task is not garbage collected mid-flight
+        publish_task = asyncio.create_task(self._publish_event(verification))
+        self._publish_tasks.add(publish_task)
+        publish_task.add_done_callback(self._publish_tasks.discard)
+        return verification
 
-            asyncio.create_task(self._publish_event(verification))
-            return verification
+    async def wait_for_publishes(self) -> None:
+        """Wait for in-flight user.verified publishes, e.g. before closing the producer."""
+        await asyncio.gather(*self._publish_tasks, return_exceptions=True)
 
     async def _publish_event(self, verification: UserVerification) -> None:
         event = UserVerifiedEvent(user_id=verification.user_id, network=verification.network.value)
@@ -1,35 +1,112 @@
 import base64
-from datetime import datetime
-from unittest.mock import AsyncMock, MagicMock
-from uuid import uuid4
+import itertools
+import random
+from datetime import UTC, datetime
+from unittest.mock import AsyncMock, MagicMock, Mock, create_autospec
+from uuid import UUID
 
 import pytest
+from sqlalchemy import select, update
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import configure_mappers
 from user_verification_service.src.core.config import Settings
 from user_verification_service.src.core.logger import Logger
 from user_verification_service.src.domain.interfaces.event_publisher import IEventPublisher
 from user_verification_service.src.domain.interfaces.repository import IVerificationRepository
 from user_verification_service.src.domain.models.verification import NetworkType, UserVerification
 from user_verification_service.src.domain.schemas.events import UserVerifiedEvent
+from user_verification_service.src.domain.schemas.requests import VerificationRequest, VerificationResponse
 from user_verification_service.src.infrastructure.database.models import VerificationModel
-from user_verification_service.src.infrastructure.kafka.producer import KafkaEventPublisher
 from user_verification_service.src.infrastructure.repositories.verification_repository import VerificationRepository
 from user_verification_service.src.services.verification_service import VerificationService
 
+_NOW = datetime(2024, 1, 1, tzinfo=UTC)
+_VALID_DOC_B64 = base64.b64encode(b"test document content").decode("utf-8")
+
+
+def _repeated_x_base64(size: int) -> str:
+    """base64 of b"x" * size without encoding it: every 3 input bytes encode to "eHh4"."""
+    return "eHh4" * (size // 3) + base64.b64encode(b"x" * (size % 3)).decode("utf-8")
+
+
+_LARGE_DOC_B64 = _repeated_x_base64(1_000_000)
+
+
+# Test ids need not be cryptographically random; a seeded PRNG is cheaper and reproducible
+_rng = random.Random(0)
+
+
+def _fake_uuid() -> UUID:
+    return UUID(int=_rng.getrandbits(128), version=4)
+
+
+class _FrozenDatetime(datetime):
+    """datetime whose now() always returns _NOW."""
+
+    @classmethod
+    def now(cls, tz=None):
+        return _NOW if tz is not None else _NOW.replace(tzinfo=None)
+
+
+# Spec'ing a mock introspects its whole spec class, so each spec'd mock fixture builds its mock once per session
+# and hands the same instance to every test with the previous test's calls, return values and side effects cleared
+_mock_templates: dict[str, Mock] = {}
+
+
+def _fresh_mock(name: str, build) -> Mock:
+    mock = _mock_templates.get(name)
+    if mock is None:
+        mock = _mock_templates[name] = build()
+    mock.reset_mock(return_value=True, side_effect=True)
+    return mock
+
+
+def _discard(*args, **kwargs) -> None:
+    return None
+
+
+class _NullLogger:
+    """Logger stand-in that drops every call without recording it."""
+
+    def __getattr__(self, name):
+        return _discard
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _warm_pydantic():
+    """Runs the first validation of each schema before any test so it is not charged to one."""
+    VerificationRequest(user_id="x", network="ethereum", document="dGVzdA==")
+    VerificationResponse(message="", verification_id="", status="")
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _warm_sqlalchemy():
+    """Configures the mappers and compiles each repository statement kind once before any test."""
+    configure_mappers()
+    select(VerificationModel).where(VerificationModel.user_id == "x").compile()
+    update(VerificationModel).where(VerificationModel.id == UUID(int=0)).values(status="pending").compile()
+    insert_stmt = pg_insert(VerificationModel).values(user_id="x", network="ethereum")
+    insert_stmt.on_conflict_do_update(
+        index_elements=[VerificationModel.user_id, VerificationModel.network],
+        set_={"status": insert_stmt.excluded.status}
+    ).returning(VerificationModel).compile(dialect=postgresql.dialect())
+
 
 @pytest.fixture
 def mock_repository():
     """Provides a mock repository for testing."""
-    return AsyncMock(spec=IVerificationRepository)
+    return _fresh_mock("repository", lambda: create_autospec(IVerificationRepository, spec_set=True, instance=True))
 
 
 @pytest.fixture
 def mock_event_publisher():
     """Provides a mock event publisher for testing."""
-    return AsyncMock(spec=IEventPublisher)
+    return _fresh_mock("event_publisher", lambda: AsyncMock(spec=IEventPublisher))
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def test_settings():
     """Provides test settings configuration."""
     return Settings(
@@ -39,9 +116,15 @@ def test_settings():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_logger():
-    """Provides a mock logger for testing."""
+    """Provides a no-op logger for tests that do not inspect log calls."""
+    return _NullLogger()
+
+
+@pytest.fixture
+def recording_logger():
+    """Provides a mock logger for tests that assert on log calls."""
     return MagicMock(spec=Logger)
 
 
@@ -57,10 +140,29 @@ def verification_service(mock_repository, mock_event_publisher, test_settings, m
 
 
 @pytest.fixture
+def uid_factory():
+    """Provides a factory of deterministic, sequential UUIDs."""
+    counter = itertools.count(1)
+    return lambda: UUID(int=next(counter))
+
+
+@pytest.fixture
+def expected_id(uid_factory):
+    """Provides the id a test expects the repository to hand back."""
+    return uid_factory()
+
+
+@pytest.fixture
+def frozen_now(monkeypatch):
+    """Freezes the domain model clock at a fixed instant and returns it."""
+    monkeypatch.setattr("user_verification_service.src.domain.models.verification.datetime", _FrozenDatetime)
+    return _NOW
+
+
+@pytest.fixture(scope="session")
 def valid_document_base64():
     """Provides a valid base64 encoded document."""
-    document_data = b"test document content"
-    return base64.b64encode(document_data).decode("utf-8")
+    return _VALID_DOC_B64
 
 
 @pytest.fixture
@@ -81,7 +183,7 @@ def verification_with_id():
         network=NetworkType.BITCOIN,
         document_hash="xyz789uvw012"
     )
-    verification.id = uuid4()
+    verification.id = _fake_uuid()
     return verification
 
 
@@ -93,7 +195,7 @@ def existing_verified_user():
         network=NetworkType.ETHEREUM,
         document_hash="existing_hash"
     )
-    verification.id = uuid4()
+    verification.id = _fake_uuid()
     verification.verify()
     return verification
 
@@ -106,54 +208,65 @@ def existing_pending_user():
         network=NetworkType.ETHEREUM,
         document_hash="pending_hash"
     )
-    verification.id = uuid4()
+    verification.id = _fake_uuid()
     return verification
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def valid_verification_request_data():
     """Provides valid data for VerificationRequest."""
     return {
         "user_id": "test_user_123",
         "network": "ethereum",
-        "document": base64.b64encode(b"test document content").decode("utf-8")
+        "document": _VALID_DOC_B64
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
+def prebuilt_verification_request(valid_verification_request_data):
+    """Provides a VerificationRequest built once for read-only tests."""
+    return VerificationRequest(**valid_verification_request_data)
+
+
+@pytest.fixture(scope="session")
 def valid_verification_response_data():
     """Provides valid data for VerificationResponse."""
     return {
         "message": "Verification in progress",
-        "verification_id": str(uuid4()),
+        "verification_id": str(_fake_uuid()),
         "status": "pending"
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_image_base64():
     """Provides a sample base64 encoded image."""
     return "iVBORw0KGgoAAAANSUhEUgAAAAUAAAAFCAYAAACNbyblAAAAHElEQVQI12P4//8/w38GIAXDIBKE0DHxgljNBAAO9TXL0Y4OHwAAAABJRU5ErkJggg=="
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def minimal_document_base64():
     """Provides a minimal valid base64 document."""
     return base64.b64encode(b"a").decode("utf-8")
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def large_document_base64():
-    """Provides a large base64 document for testing limits."""
-    large_data = b"x" * 1000000  # 1MB of data
-    return base64.b64encode(large_data).decode("utf-8")
+    """Provides a large base64 document (1MB decoded) for testing limits."""
+    return _LARGE_DOC_B64
+
+
+@pytest.fixture(scope="session")
+def oversized_document_base64(test_settings):
+    """Provides a base64 document one byte over the configured size limit."""
+    return _repeated_x_base64(test_settings.max_document_size_mb * 1024 * 1024 + 1)
 
 
 @pytest.fixture
 def mock_async_session():
     """Provides a mock async database session for testing."""
-    session = AsyncMock(spec=AsyncSession)
-    return session
+    # spec_set rejects attributes AsyncSession does not have, so typos in tests fail loudly
+    return _fresh_mock("async_session", lambda: AsyncMock(spec_set=AsyncSession))
 
 
 @pytest.fixture
@@ -162,32 +275,32 @@ def verification_repository(mock_async_session):
     return VerificationRepository(mock_async_session)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def verification_model():
     """Provides a sample VerificationModel for testing."""
     return VerificationModel(
-        id=uuid4(),
+        id=_fake_uuid(),
         user_id="test_user_123",
         network="ethereum",
         document_hash="abc123def456",
         status="pending",
         verified_at=None,
-        created_at=datetime.now(),
+        created_at=_NOW,
         version=1
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def verified_verification_model():
     """Provides a verified VerificationModel for testing."""
     return VerificationModel(
-        id=uuid4(),
+        id=_fake_uuid(),
         user_id="verified_user",
         network="bitcoin",
         document_hash="verified_hash",
         status="verified",
-        verified_at=datetime.now(),
-        created_at=datetime.now(),
+        verified_at=_NOW,
+        created_at=_NOW,
         version=1
     )
 
@@ -208,7 +321,7 @@ def user_verified_event():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def multiple_user_verified_events():
     """Provides multiple UserVerifiedEvent instances for batch testing."""
     return [
@@ -218,9 +331,13 @@ def multiple_user_verified_events():
     ]
 
 
-@pytest.fixture
-def mock_kafka_producer():
-    """Provides a mock AIOKafkaProducer for testing."""
+@pytest.fixture(scope="session")
+def multiple_kafka_messages(multiple_user_verified_events):
+    """Provides the kafka messages of multiple_user_verified_events, serialized once."""
+    return [event.kafka_message for event in multiple_user_verified_events]
+
+
+def _kafka_producer_mock() -> AsyncMock:
     from aiokafka import AIOKafkaProducer
     producer = AsyncMock(spec=AIOKafkaProducer)
     producer.send_and_wait = AsyncMock()
@@ -230,16 +347,24 @@ def mock_kafka_producer():
     return producer
 
 
+@pytest.fixture
+def mock_kafka_producer():
+    """Provides a mock AIOKafkaProducer for testing."""
+    return _fresh_mock("kafka_producer", _kafka_producer_mock)
+
+
 @pytest.fixture
 def kafka_event_publisher(test_settings, mock_logger):
     """Provides a KafkaEventPublisher instance for testing."""
+    # Imported lazily so runs without Kafka tests never load aiokafka
+    from user_verification_service.src.infrastructure.kafka.producer import KafkaEventPublisher
     return KafkaEventPublisher(
         settings=test_settings,
         logger=mock_logger
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def kafka_settings():
     """Provides Kafka-specific settings for testing."""
     return Settings(
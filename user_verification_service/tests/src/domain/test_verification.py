@@ -1,52 +1,52 @@
-from datetime import datetime, timedelta
-from uuid import uuid4
+from datetime import UTC, datetime, timedelta
 
+import pytest
 from user_verification_service.src.domain.models.verification import (
     NetworkType,
     UserVerification,
     VerificationStatus,
 )
 
+_NOW = datetime(2024, 1, 1, tzinfo=UTC)
+
 
 class TestVerificationStatus:
     """Test cases for VerificationStatus enum."""
 
-    def test_verification_status_values(self):
-        # Arrange & Act & Assert
-        assert VerificationStatus.PENDING == "pending"
-        assert VerificationStatus.VERIFIED == "verified"
-        assert VerificationStatus.FAILED == "failed"
-
-    def test_verification_status_string_inheritance(self):
-        # Arrange
-        status = VerificationStatus.PENDING
+    __slots__ = ()
 
+    @pytest.mark.parametrize(("member", "value"), [
+        (VerificationStatus.PENDING, "pending"),
+        (VerificationStatus.VERIFIED, "verified"),
+        (VerificationStatus.FAILED, "failed")
+    ])
+    def test_verification_status_values(self, member, value):
         # Act & Assert
-        assert isinstance(status, str)
-        assert status == "pending"
+        assert isinstance(member, str)
+        assert member == value
 
 
 class TestNetworkType:
     """Test cases for NetworkType enum."""
 
-    def test_network_type_values(self):
-        # Arrange & Act & Assert
-        assert NetworkType.ETHEREUM == "ethereum"
-        assert NetworkType.TRON == "tron"
-        assert NetworkType.BITCOIN == "bitcoin"
-
-    def test_network_type_string_inheritance(self):
-        # Arrange
-        network = NetworkType.ETHEREUM
+    __slots__ = ()
 
+    @pytest.mark.parametrize(("member", "value"), [
+        (NetworkType.ETHEREUM, "ethereum"),
+        (NetworkType.TRON, "tron"),
+        (NetworkType.BITCOIN, "bitcoin")
+    ])
+    def test_network_type_values(self, member, value):
         # Act & Assert
-        assert isinstance(network, str)
-        assert network == "ethereum"
+        assert isinstance(member, str)
+        assert member == value
 
 
 class TestUserVerification:
     """Test cases for UserVerification domain model."""
 
+    __slots__ = ()
+
     def test_user_verification_creation_with_required_fields(self):
         # Arrange
         user_id = "test_user_123"
@@ -69,15 +69,15 @@ class TestUserVerification:
         assert verification.verified_at is None
         assert isinstance(verification.created_at, datetime)
 
-    def test_user_verification_creation_with_all_fields(self):
+    def test_user_verification_creation_with_all_fields(self, uid_factory):
         # Arrange
         user_id = "test_user_456"
         network = NetworkType.TRON
         document_hash = "def456ghi789"
-        verification_id = uuid4()
+        verification_id = uid_factory()
         status = VerificationStatus.VERIFIED
-        verified_at = datetime.now()
-        created_at = datetime.now() - timedelta(hours=1)
+        verified_at = _NOW
+        created_at = _NOW - timedelta(hours=1)
 
         # Act
         verification = UserVerification(
@@ -99,100 +99,54 @@ class TestUserVerification:
         assert verification.verified_at == verified_at
         assert verification.created_at == created_at
 
-    def test_user_verification_default_created_at_is_recent(self):
-        # Arrange
-        before_creation = datetime.now()
-
+    def test_user_verification_default_created_at_is_now(self, frozen_now):
         # Act
         verification = UserVerification(
             user_id="test_user",
             network=NetworkType.ETHEREUM,
             document_hash="hash123"
         )
-        after_creation = datetime.now()
 
         # Assert
-        assert before_creation <= verification.created_at <= after_creation
+        assert verification.created_at == frozen_now
 
-    def test_verify_method_updates_status_and_timestamp(self, valid_user_verification):
+    def test_verify_method_updates_status_and_timestamp(self, frozen_now, valid_user_verification):
         # Arrange
         initial_status = valid_user_verification.status
         initial_verified_at = valid_user_verification.verified_at
-        before_verify = datetime.now()
 
         # Act
         valid_user_verification.verify()
-        after_verify = datetime.now()
 
         # Assert
         assert initial_status == VerificationStatus.PENDING
         assert initial_verified_at is None
         assert valid_user_verification.status == VerificationStatus.VERIFIED
-        assert valid_user_verification.verified_at is not None
-        assert before_verify <= valid_user_verification.verified_at <= after_verify
-
-    def test_verify_method_on_already_verified_user(self, valid_user_verification):
-        # Arrange
-        valid_user_verification.verify()
-        first_verified_at = valid_user_verification.verified_at
-
-        # Act
-        valid_user_verification.verify()
-        second_verified_at = valid_user_verification.verified_at
-
-        # Assert
-        assert valid_user_verification.status == VerificationStatus.VERIFIED
-        assert second_verified_at >= first_verified_at
-
-    def test_verify_method_on_failed_verification(self, valid_user_verification):
-        # Arrange
-        valid_user_verification.fail()
-        assert valid_user_verification.status == VerificationStatus.FAILED
-
-        # Act
-        valid_user_verification.verify()
-
-        # Assert
-        assert valid_user_verification.status == VerificationStatus.VERIFIED
-        assert valid_user_verification.verified_at is not None
-
-    def test_fail_method_updates_status_only(self, valid_user_verification):
-        # Arrange
-        initial_status = valid_user_verification.status
-        initial_verified_at = valid_user_verification.verified_at
-
-        # Act
-        valid_user_verification.fail()
-
-        # Assert
-        assert initial_status == VerificationStatus.PENDING
-        assert initial_verified_at is None
-        assert valid_user_verification.status == VerificationStatus.FAILED
-        assert valid_user_verification.verified_at is None
-
-    def test_fail_method_on_verified_user(self, valid_user_verification):
-        # Arrange
-        valid_user_verification.verify()
-        verified_at = valid_user_verification.verified_at
-
-        # Act
-        valid_user_verification.fail()
-
-        # Assert
-        assert valid_user_verification.status == VerificationStatus.FAILED
-        assert valid_user_verification.verified_at == verified_at
-
-    def test_fail_method_on_already_failed_verification(self, valid_user_verification):
+        assert valid_user_verification.verified_at == frozen_now
+
+    @pytest.mark.parametrize(("ops", "expected_status", "expect_verified_at"), [
+        ((), VerificationStatus.PENDING, False),
+        (("verify", "verify"), VerificationStatus.VERIFIED, True),
+        (("fail",), VerificationStatus.FAILED, False),
+        (("fail", "fail"), VerificationStatus.FAILED, False),
+        (("fail", "verify"), VerificationStatus.VERIFIED, True),
+        (("verify", "fail"), VerificationStatus.FAILED, True),
+        (("verify", "fail", "verify"), VerificationStatus.VERIFIED, True)
+    ])
+    def test_user_verification_state_transitions(self, valid_user_verification, ops, expected_status, expect_verified_at):
         # Arrange
-        valid_user_verification.fail()
-        assert valid_user_verification.status == VerificationStatus.FAILED
+        last_verified_at = None
 
         # Act
-        valid_user_verification.fail()
+        for op in ops:
+            getattr(valid_user_verification, op)()
+            if op == "verify":
+                last_verified_at = valid_user_verification.verified_at
 
-        # Assert
-        assert valid_user_verification.status == VerificationStatus.FAILED
-        assert valid_user_verification.verified_at is None
+        # Assert: fail() keeps the timestamp of the last verify()
+        assert valid_user_verification.status == expected_status
+        assert (valid_user_verification.verified_at is not None) is expect_verified_at
+        assert valid_user_verification.verified_at == last_verified_at
 
     def test_user_verification_with_different_networks(self):
         # Arrange & Act
@@ -219,22 +173,31 @@ class TestUserVerification:
 
     def test_user_verification_dataclass_equality(self):
         # Arrange
+        created_at = _NOW
         verification1 = UserVerification(
             user_id="user1",
             network=NetworkType.ETHEREUM,
-            document_hash="hash1"
+            document_hash="hash1",
+            created_at=created_at
         )
         verification2 = UserVerification(
             user_id="user1",
             network=NetworkType.ETHEREUM,
-            document_hash="hash1"
+            document_hash="hash1",
+            created_at=created_at
         )
 
         # Act & Assert
-        assert verification1.user_id == verification2.user_id
-        assert verification1.network == verification2.network
-        assert verification1.document_hash == verification2.document_hash
-        assert verification1.status == verification2.status
+        assert verification1 == verification2
+
+    def test_user_verification_is_unhashable(self, valid_user_verification):
+        # Act & Assert
+        with pytest.raises(TypeError):
+            hash(valid_user_verification)
+
+    def test_user_verification_has_no_instance_dict(self, valid_user_verification):
+        # Act & Assert
+        assert not hasattr(valid_user_verification, "__dict__")
 
     def test_user_verification_with_empty_user_id(self):
         # Arrange & Act
@@ -259,23 +222,3 @@ class TestUserVerification:
         # Assert
         assert verification.user_id == "user123"
         assert verification.document_hash == ""
-
-    def test_user_verification_state_transitions(self, valid_user_verification):
-        # Arrange
-        assert valid_user_verification.status == VerificationStatus.PENDING
-
-        # Act & Assert: PENDING -> VERIFIED
-        valid_user_verification.verify()
-        assert valid_user_verification.status == VerificationStatus.VERIFIED
-        assert valid_user_verification.verified_at is not None
-
-        # Act & Assert: VERIFIED -> FAILED
-        verified_at = valid_user_verification.verified_at
-        valid_user_verification.fail()
-        assert valid_user_verification.status == VerificationStatus.FAILED
-        assert valid_user_verification.verified_at == verified_at
-
-        # Act & Assert: FAILED -> VERIFIED
-        valid_user_verification.verify()
-        assert valid_user_verification.status == VerificationStatus.VERIFIED
-        assert valid_user_verification.verified_at >= verified_at
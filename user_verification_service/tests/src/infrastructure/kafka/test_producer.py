@@ -1,16 +1,79 @@
 import asyncio
+from collections import Counter
 from datetime import datetime
-from unittest.mock import AsyncMock, patch
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
-from aiokafka import AIOKafkaProducer
+from aiokafka.partitioner import DefaultPartitioner
 from user_verification_service.src.domain.schemas.events import UserVerifiedEvent
 from user_verification_service.src.infrastructure.kafka.producer import KafkaEventPublisher
 
+pytestmark = pytest.mark.xdist_group(name="kafka_io")
+
+_KAFKA_ERR = Exception("Kafka connection failed")
+_BROKER_ERR = Exception("Broker unavailable")
+_SEND_ERR = Exception("Send failed")
+_ALL_SENDS_ERR = Exception("All sends failed")
+_STOP_ERR = Exception("Stop failed")
+
+
+def _resolved_future(exception=None):
+    """Build an already-resolved delivery future as returned by send_batch."""
+    future = asyncio.get_running_loop().create_future()
+    if exception is None:
+        future.set_result(None)
+    else:
+        future.set_exception(exception)
+    return future
+
+
+def _fake_producer():
+    """Build a lightweight producer stand-in exposing only the methods the publisher calls."""
+    return SimpleNamespace(
+        start=AsyncMock(),
+        stop=AsyncMock(),
+        # send() resolves to a delivery future that publish() awaits for the broker ack
+        send=AsyncMock(side_effect=lambda **_: _resolved_future()),
+        send_and_wait=AsyncMock(),
+        partitions_for=AsyncMock(),
+        create_batch=MagicMock(),
+        send_batch=AsyncMock()
+    )
+
+
+def _batching_producer(partitions=frozenset({0})):
+    """Build a producer stand-in wired for the create_batch/send_batch API."""
+    producer = _fake_producer()
+    producer.partitions_for.return_value = set(partitions)
+    producer.send_batch.side_effect = lambda *args, **kwargs: _resolved_future()
+    return producer
+
+
+def _message_multiset(messages):
+    """Count messages by content so call lists compare in one pass regardless of order."""
+    return Counter(frozenset(message.items()) for message in messages)
+
+
+@pytest.fixture
+def fake_producer():
+    """Provides a producer stand-in without spec introspection of AIOKafkaProducer."""
+    return _fake_producer()
+
+
+@pytest.fixture
+def mock_producer_class(monkeypatch, fake_producer):
+    """Replaces the AIOKafkaProducer class used by the publisher with a mock building fake_producer."""
+    producer_class = MagicMock(return_value=fake_producer)
+    monkeypatch.setattr("user_verification_service.src.infrastructure.kafka.producer.AIOKafkaProducer", producer_class)
+    return producer_class
+
 
 class TestKafkaEventPublisher:
     """Test cases for KafkaEventPublisher."""
 
+    __slots__ = ()
+
     def test_kafka_event_publisher_initialization(self, test_settings, mock_logger):
         """Test that KafkaEventPublisher initializes correctly."""
         # Arrange & Act
@@ -21,32 +84,31 @@ class TestKafkaEventPublisher:
         assert publisher.logger == mock_logger
         assert publisher._producer is None
 
-    async def test_get_producer_creates_new_producer_on_first_call(self, kafka_event_publisher, test_settings):
+    async def test_get_producer_creates_new_producer_on_first_call(self, kafka_event_publisher, test_settings, mock_producer_class):
         """Test that get_producer creates a new producer on first call."""
         # Arrange
-        with patch("user_verification_service.src.infrastructure.kafka.producer.AIOKafkaProducer") as mock_producer_class:
-            mock_producer = AsyncMock(spec=AIOKafkaProducer)
-            mock_producer_class.return_value = mock_producer
-
-            # Act
-            result = await kafka_event_publisher.get_producer()
-
-            # Assert
-            mock_producer_class.assert_called_once()
-            call_args = mock_producer_class.call_args
-            assert call_args.kwargs["bootstrap_servers"] == test_settings.kafka_bootstrap_servers
-            assert call_args.kwargs["acks"] == test_settings.kafka_producer_config["acks"]
-            assert call_args.kwargs["compression_type"] == test_settings.kafka_producer_config["compression_type"]
-            assert callable(call_args.kwargs["value_serializer"])
-            assert callable(call_args.kwargs["key_serializer"])
-            mock_producer.start.assert_called_once()
-            assert result == mock_producer
-            assert kafka_event_publisher._producer == mock_producer
-
-    async def test_get_producer_returns_existing_producer_on_subsequent_calls(self, kafka_event_publisher):
+        mock_producer = mock_producer_class.return_value
+
+        # Act
+        result = await kafka_event_publisher.get_producer()
+
+        # Assert
+        mock_producer_class.assert_called_once()
+        call_args = mock_producer_class.call_args
+        assert call_args.kwargs["bootstrap_servers"] == test_settings.kafka_bootstrap_servers
+        assert call_args.kwargs["acks"] == test_settings.kafka_producer_config["acks"]
+        assert call_args.kwargs["compression_type"] == test_settings.kafka_producer_config["compression_type"]
+        assert call_args.kwargs["enable_idempotence"] is True
+        assert callable(call_args.kwargs["value_serializer"])
+        assert callable(call_args.kwargs["key_serializer"])
+        mock_producer.start.assert_called_once()
+        assert result == mock_producer
+        assert kafka_event_publisher._producer == mock_producer
+
+    async def test_get_producer_returns_existing_producer_on_subsequent_calls(self, kafka_event_publisher, fake_producer):
         """Test that get_producer returns existing producer on subsequent calls."""
         # Arrange
-        existing_producer = AsyncMock(spec=AIOKafkaProducer)
+        existing_producer = fake_producer
         kafka_event_publisher._producer = existing_producer
 
         # Act
@@ -56,166 +118,230 @@ class TestKafkaEventPublisher:
         assert result == existing_producer
         existing_producer.start.assert_not_called()
 
-    async def test_get_producer_configures_serializers_correctly(self, kafka_event_publisher, test_settings):
+    async def test_get_producer_configures_serializers_correctly(self, kafka_event_publisher, test_settings, mock_producer_class):
         """Test that get_producer configures serializers correctly."""
-        # Arrange
-        with patch("user_verification_service.src.infrastructure.kafka.producer.AIOKafkaProducer") as mock_producer_class:
-            mock_producer = AsyncMock(spec=AIOKafkaProducer)
-            mock_producer_class.return_value = mock_producer
-
-            # Act
-            await kafka_event_publisher.get_producer()
-
-            # Assert
-            call_args = mock_producer_class.call_args
-            assert "value_serializer" in call_args.kwargs
-            assert "key_serializer" in call_args.kwargs
-            assert callable(call_args.kwargs["value_serializer"])
-            assert callable(call_args.kwargs["key_serializer"])
-
-            # Test that serializers work correctly
-            value_serializer = call_args.kwargs["value_serializer"]
-            key_serializer = call_args.kwargs["key_serializer"]
-            assert value_serializer("test") == "test"
-            assert key_serializer("key") == "key"
-
-    async def test_publish_single_event_successfully(self, kafka_event_publisher, user_verified_event, test_settings):
+        # Act
+        await kafka_event_publisher.get_producer()
+
+        # Assert
+        call_args = mock_producer_class.call_args
+        assert "value_serializer" in call_args.kwargs
+        assert "key_serializer" in call_args.kwargs
+        assert callable(call_args.kwargs["value_serializer"])
+        assert callable(call_args.kwargs["key_serializer"])
+
+        # Test that serializers work correctly
+        value_serializer = call_args.kwargs["value_serializer"]
+        key_serializer = call_args.kwargs["key_serializer"]
+        assert value_serializer("test") == b"test"
+        assert key_serializer("key") == "key"
+
+    async def test_publish_single_event_successfully(self, kafka_event_publisher, user_verified_event, test_settings, fake_producer):
         """Test publishing a single event successfully."""
         # Arrange
-        mock_producer = AsyncMock(spec=AIOKafkaProducer)
+        mock_producer = fake_producer
         kafka_event_publisher._producer = mock_producer
-        expected_message = user_verified_event.to_kafka_message()
+        expected_message = user_verified_event.kafka_message
 
         # Act
         await kafka_event_publisher.publish(user_verified_event)
 
         # Assert
-        mock_producer.send_and_wait.assert_called_once_with(
+        mock_producer.send.assert_called_once_with(
             topic=test_settings.kafka_topic_user_verified,
             **expected_message
         )
 
-    async def test_publish_single_event_creates_producer_if_none_exists(self, kafka_event_publisher, user_verified_event, test_settings):
+    async def test_publish_single_event_creates_producer_if_none_exists(self, kafka_event_publisher, user_verified_event, test_settings, mock_producer_class):
         """Test that publish creates producer if none exists."""
         # Arrange
-        with patch("user_verification_service.src.infrastructure.kafka.producer.AIOKafkaProducer") as mock_producer_class:
-            mock_producer = AsyncMock(spec=AIOKafkaProducer)
-            mock_producer_class.return_value = mock_producer
+        mock_producer = mock_producer_class.return_value
 
-            # Act
-            await kafka_event_publisher.publish(user_verified_event)
+        # Act
+        await kafka_event_publisher.publish(user_verified_event)
 
-            # Assert
-            mock_producer_class.assert_called_once()
-            mock_producer.start.assert_called_once()
-            mock_producer.send_and_wait.assert_called_once()
+        # Assert
+        mock_producer_class.assert_called_once()
+        mock_producer.start.assert_called_once()
+        mock_producer.send.assert_called_once()
 
-    async def test_publish_single_event_handles_kafka_error(self, kafka_event_publisher, user_verified_event, mock_logger):
+    async def test_publish_single_event_handles_kafka_error(self, kafka_event_publisher, user_verified_event, recording_logger, fake_producer):
         """Test that publish handles Kafka errors correctly."""
         # Arrange
-        mock_producer = AsyncMock(spec=AIOKafkaProducer)
-        kafka_error = Exception("Kafka connection failed")
-        mock_producer.send_and_wait.side_effect = kafka_error
+        kafka_event_publisher.logger = recording_logger
+        mock_producer = fake_producer
+        mock_producer.send.side_effect = _KAFKA_ERR
         kafka_event_publisher._producer = mock_producer
 
         # Act & Assert
         with pytest.raises(Exception, match="Kafka connection failed"):
             await kafka_event_publisher.publish(user_verified_event)
 
-        mock_logger.error.assert_called_once_with("Failed to publish event: Kafka connection failed")
+        recording_logger.error.assert_called_once_with("Failed to publish event: Kafka connection failed")
+
+    async def test_publish_single_event_raises_on_failed_delivery(self, kafka_event_publisher, user_verified_event, recording_logger, fake_producer):
+        """Test that broker delivery failures propagate to the caller once the send future resolves."""
+        # Arrange
+        kafka_event_publisher.logger = recording_logger
+        mock_producer = fake_producer
+        mock_producer.send.side_effect = lambda **_: _resolved_future(_BROKER_ERR)
+        kafka_event_publisher._producer = mock_producer
 
-    async def test_publish_single_event_uses_correct_message_format(self, kafka_event_publisher, user_verified_event, test_settings):
+        # Act & Assert
+        with pytest.raises(Exception, match="Broker unavailable"):
+            await kafka_event_publisher.publish(user_verified_event)
+
+        recording_logger.error.assert_called_once_with("Failed to publish event: Broker unavailable")
+
+    async def test_publish_single_event_uses_correct_message_format(self, kafka_event_publisher, user_verified_event, test_settings, fake_producer):
         """Test that publish uses correct message format from event."""
         # Arrange
-        mock_producer = AsyncMock(spec=AIOKafkaProducer)
+        mock_producer = fake_producer
         kafka_event_publisher._producer = mock_producer
 
         # Act
         await kafka_event_publisher.publish(user_verified_event)
 
         # Assert
-        call_args = mock_producer.send_and_wait.call_args
-        assert call_args.kwargs["topic"] == test_settings.kafka_topic_user_verified
-        assert "key" in call_args.kwargs
-        assert "value" in call_args.kwargs
-        assert "headers" in call_args.kwargs
+        mock_producer.send.assert_called_once_with(
+            topic=test_settings.kafka_topic_user_verified,
+            **user_verified_event.kafka_message
+        )
 
-    async def test_publish_batch_events_successfully(self, kafka_event_publisher, multiple_user_verified_events, test_settings):
+    async def test_publish_batch_events_successfully(self, kafka_event_publisher, multiple_user_verified_events, multiple_kafka_messages, test_settings):
         """Test publishing multiple events in batch successfully."""
         # Arrange
-        mock_producer = AsyncMock(spec=AIOKafkaProducer)
+        mock_producer = _batching_producer()
         kafka_event_publisher._producer = mock_producer
-
-        # Mock successful futures for all events
-        mock_futures = [AsyncMock() for _ in multiple_user_verified_events]
-        mock_producer.send.side_effect = mock_futures
+        batch = mock_producer.create_batch.return_value
 
         # Act
         await kafka_event_publisher.publish_batch(multiple_user_verified_events)
 
         # Assert
-        assert mock_producer.send.call_count == len(multiple_user_verified_events)
-        for i, event in enumerate(multiple_user_verified_events):
-            expected_message = event.to_kafka_message()
-            mock_producer.send.assert_any_call(
-                topic=test_settings.kafka_topic_user_verified,
-                **expected_message
-            )
-
-    async def test_publish_batch_events_creates_producer_if_none_exists(self, kafka_event_publisher, multiple_user_verified_events):
+        assert _message_multiset(call.kwargs for call in batch.append.call_args_list) == _message_multiset(
+            {"timestamp": None, **message} for message in multiple_kafka_messages
+        )
+        mock_producer.send_batch.assert_called_once_with(batch, test_settings.kafka_topic_user_verified, partition=0)
+
+    async def test_publish_batch_events_creates_producer_if_none_exists(self, kafka_event_publisher, multiple_user_verified_events, mock_producer_class):
         """Test that publish_batch creates producer if none exists."""
         # Arrange
-        with patch("user_verification_service.src.infrastructure.kafka.producer.AIOKafkaProducer") as mock_producer_class:
-            mock_producer = AsyncMock(spec=AIOKafkaProducer)
-            mock_producer_class.return_value = mock_producer
-            mock_futures = [AsyncMock() for _ in multiple_user_verified_events]
-            mock_producer.send.side_effect = mock_futures
+        mock_producer = mock_producer_class.return_value = _batching_producer()
 
-            # Act
-            await kafka_event_publisher.publish_batch(multiple_user_verified_events)
+        # Act
+        await kafka_event_publisher.publish_batch(multiple_user_verified_events)
 
-            # Assert
-            mock_producer_class.assert_called_once()
-            mock_producer.start.assert_called_once()
-            assert mock_producer.send.call_count == len(multiple_user_verified_events)
+        # Assert
+        mock_producer_class.assert_called_once()
+        mock_producer.start.assert_called_once()
+        mock_producer.send_batch.assert_called_once()
 
-    async def test_publish_batch_events_handles_partial_failures(self, kafka_event_publisher, multiple_user_verified_events, mock_logger):
-        """Test that publish_batch handles partial failures correctly."""
+    async def test_publish_batch_flushes_full_batch_and_continues(self, kafka_event_publisher, multiple_user_verified_events):
+        """Test that a full batch is sent and the remaining events go into a fresh batch."""
         # Arrange
-        mock_producer = AsyncMock(spec=AIOKafkaProducer)
+        mock_producer = _batching_producer()
         kafka_event_publisher._producer = mock_producer
+        full_batch = MagicMock()
+        full_batch.append.side_effect = [MagicMock(), None]
+        next_batch = MagicMock()
+        mock_producer.create_batch.side_effect = [full_batch, next_batch]
 
-        # Mock mixed success and failure results
-        success_future = AsyncMock()
-        failure_exception = Exception("Send failed")
-        mock_producer.send.side_effect = [success_future, failure_exception, success_future]
+        # Act
+        await kafka_event_publisher.publish_batch(multiple_user_verified_events)
+
+        # Assert
+        assert mock_producer.send_batch.call_count == 2
+        assert mock_producer.send_batch.call_args_list[0].args[0] is full_batch
+        assert mock_producer.send_batch.call_args_list[1].args[0] is next_batch
+        assert next_batch.append.call_count == 2
+
+    async def test_publish_batch_routes_events_by_key(self, kafka_event_publisher, multiple_user_verified_events, multiple_kafka_messages):
+        """Test that events are grouped into per-partition batches using their key."""
+        # Arrange
+        mock_producer = _batching_producer(partitions={0, 1, 2})
+        kafka_event_publisher._producer = mock_producer
+        expected_partitions = {
+            DefaultPartitioner()(message["key"], [0, 1, 2], [0, 1, 2])
+            for message in multiple_kafka_messages
+        }
+
+        # Act
+        await kafka_event_publisher.publish_batch(multiple_user_verified_events)
+
+        # Assert
+        sent_partitions = {call.kwargs["partition"] for call in mock_producer.send_batch.call_args_list}
+        assert sent_partitions == expected_partitions
+        assert mock_producer.send_batch.call_count == len(expected_partitions)
+
+    async def test_publish_batch_sends_every_batch_before_awaiting_deliveries(self, kafka_event_publisher, multiple_user_verified_events):
+        """Test that all batches are handed to the producer before any delivery is awaited."""
+        # Arrange
+        mock_producer = _batching_producer()
+        kafka_event_publisher._producer = mock_producer
+        full_batch = MagicMock()
+        full_batch.append.side_effect = [MagicMock(), None]
+        mock_producer.create_batch.side_effect = [full_batch, MagicMock()]
+        order = []
+
+        def acknowledge(future):
+            order.append("end")
+            future.set_result(None)
+
+        async def send_batch(*args, **kwargs):
+            order.append("start")
+            future = asyncio.get_running_loop().create_future()
+            # Resolves on the next loop iteration, i.e. as soon as the publisher yields
+            asyncio.get_running_loop().call_soon(acknowledge, future)
+            return future
+
+        mock_producer.send_batch.side_effect = send_batch
+
+        # Act
+        await kafka_event_publisher.publish_batch(multiple_user_verified_events)
+
+        # Assert
+        assert order == ["start", "start", "end", "end"]
+
+    async def test_publish_batch_events_handles_partial_failures(self, kafka_event_publisher, multiple_user_verified_events, recording_logger):
+        """Test that publish_batch handles partial failures correctly."""
+        # Arrange
+        kafka_event_publisher.logger = recording_logger
+        mock_producer = _batching_producer()
+        kafka_event_publisher._producer = mock_producer
+        full_batch = MagicMock()
+        full_batch.append.side_effect = [MagicMock(), None]
+        mock_producer.create_batch.side_effect = [full_batch, MagicMock()]
+        mock_producer.send_batch.side_effect = [
+            _resolved_future(),
+            _resolved_future(exception=_SEND_ERR)
+        ]
 
         # Act & Assert
         with pytest.raises(Exception, match="Batch publish partially failed"):
             await kafka_event_publisher.publish_batch(multiple_user_verified_events)
 
-        mock_logger.error.assert_called_once_with("Batch publish had 1 failures")
+        recording_logger.error.assert_called_once_with("Batch publish had 1 failures")
 
-    async def test_publish_batch_events_handles_all_failures(self, kafka_event_publisher, multiple_user_verified_events, mock_logger):
+    async def test_publish_batch_events_handles_all_failures(self, kafka_event_publisher, multiple_user_verified_events, recording_logger):
         """Test that publish_batch handles all failures correctly."""
         # Arrange
-        mock_producer = AsyncMock(spec=AIOKafkaProducer)
+        kafka_event_publisher.logger = recording_logger
+        mock_producer = _batching_producer()
         kafka_event_publisher._producer = mock_producer
-
-        # Mock all failures
-        failure_exception = Exception("All sends failed")
-        mock_producer.send.side_effect = [failure_exception] * len(multiple_user_verified_events)
+        mock_producer.send_batch.side_effect = None
+        mock_producer.send_batch.return_value = _resolved_future(exception=_ALL_SENDS_ERR)
 
         # Act & Assert
         with pytest.raises(Exception, match="Batch publish partially failed"):
             await kafka_event_publisher.publish_batch(multiple_user_verified_events)
 
-        mock_logger.error.assert_called_once_with(f"Batch publish had {len(multiple_user_verified_events)} failures")
+        recording_logger.error.assert_called_once_with("Batch publish had 1 failures")
 
     async def test_publish_batch_empty_list_succeeds(self, kafka_event_publisher):
         """Test that publish_batch with empty list succeeds without error."""
         # Arrange
-        mock_producer = AsyncMock(spec=AIOKafkaProducer)
+        mock_producer = _batching_producer()
         kafka_event_publisher._producer = mock_producer
         empty_events = []
 
@@ -223,29 +349,27 @@ class TestKafkaEventPublisher:
         await kafka_event_publisher.publish_batch(empty_events)
 
         # Assert
-        mock_producer.send.assert_not_called()
+        mock_producer.create_batch.assert_not_called()
+        mock_producer.send_batch.assert_not_called()
 
     async def test_publish_batch_single_event_works(self, kafka_event_publisher, user_verified_event, test_settings):
         """Test that publish_batch works with single event."""
         # Arrange
-        mock_producer = AsyncMock(spec=AIOKafkaProducer)
+        mock_producer = _batching_producer()
         kafka_event_publisher._producer = mock_producer
-        mock_future = AsyncMock()
-        mock_producer.send.return_value = mock_future
+        batch = mock_producer.create_batch.return_value
 
         # Act
         await kafka_event_publisher.publish_batch([user_verified_event])
 
         # Assert
-        mock_producer.send.assert_called_once_with(
-            topic=test_settings.kafka_topic_user_verified,
-            **user_verified_event.to_kafka_message()
-        )
+        batch.append.assert_called_once_with(timestamp=None, **user_verified_event.kafka_message)
+        mock_producer.send_batch.assert_called_once_with(batch, test_settings.kafka_topic_user_verified, partition=0)
 
     async def test_close_stops_producer_if_exists(self, kafka_event_publisher):
         """Test that close stops the producer if it exists."""
         # Arrange
-        mock_producer = AsyncMock(spec=AIOKafkaProducer)
+        mock_producer = SimpleNamespace(stop=AsyncMock())
         kafka_event_publisher._producer = mock_producer
 
         # Act
@@ -267,8 +391,7 @@ class TestKafkaEventPublisher:
     async def test_close_handles_producer_stop_error(self, kafka_event_publisher):
         """Test that close handles producer stop errors gracefully."""
         # Arrange
-        mock_producer = AsyncMock(spec=AIOKafkaProducer)
-        mock_producer.stop.side_effect = Exception("Stop failed")
+        mock_producer = SimpleNamespace(stop=AsyncMock(side_effect=_STOP_ERR))
         kafka_event_publisher._producer = mock_producer
 
         # Act & Assert - should raise exception since close doesn't handle errors
@@ -276,28 +399,24 @@ class TestKafkaEventPublisher:
             await kafka_event_publisher.close()
         mock_producer.stop.assert_called_once()
 
-    async def test_publisher_uses_correct_kafka_settings(self, kafka_settings, mock_logger):
+    async def test_publisher_uses_correct_kafka_settings(self, kafka_settings, mock_logger, mock_producer_class):
         """Test that publisher uses correct Kafka settings from configuration."""
         # Arrange
         publisher = KafkaEventPublisher(kafka_settings, mock_logger)
 
-        with patch("user_verification_service.src.infrastructure.kafka.producer.AIOKafkaProducer") as mock_producer_class:
-            mock_producer = AsyncMock(spec=AIOKafkaProducer)
-            mock_producer_class.return_value = mock_producer
-
-            # Act
-            await publisher.get_producer()
-
-            # Assert
-            mock_producer_class.assert_called_once()
-            call_args = mock_producer_class.call_args
-            assert call_args.kwargs["bootstrap_servers"] == kafka_settings.kafka_bootstrap_servers
-            assert call_args.kwargs["acks"] == kafka_settings.kafka_producer_config["acks"]
-            assert call_args.kwargs["compression_type"] == kafka_settings.kafka_producer_config["compression_type"]
-            assert callable(call_args.kwargs["value_serializer"])
-            assert callable(call_args.kwargs["key_serializer"])
+        # Act
+        await publisher.get_producer()
 
-    async def test_publish_event_with_custom_timestamp(self, kafka_event_publisher, test_settings):
+        # Assert
+        mock_producer_class.assert_called_once()
+        call_args = mock_producer_class.call_args
+        assert call_args.kwargs["bootstrap_servers"] == kafka_settings.kafka_bootstrap_servers
+        assert call_args.kwargs["acks"] == kafka_settings.kafka_producer_config["acks"]
+        assert call_args.kwargs["compression_type"] == kafka_settings.kafka_producer_config["compression_type"]
+        assert callable(call_args.kwargs["value_serializer"])
+        assert callable(call_args.kwargs["key_serializer"])
+
+    async def test_publish_event_with_custom_timestamp(self, kafka_event_publisher, test_settings, fake_producer):
         """Test publishing event with custom timestamp."""
         # Arrange
         custom_timestamp = datetime(2023, 1, 1, 12, 0, 0)
@@ -306,20 +425,18 @@ class TestKafkaEventPublisher:
             network="ethereum",
             timestamp=custom_timestamp
         )
-        mock_producer = AsyncMock(spec=AIOKafkaProducer)
+        mock_producer = fake_producer
         kafka_event_publisher._producer = mock_producer
 
         # Act
         await kafka_event_publisher.publish(custom_event)
 
         # Assert
-        call_args = mock_producer.send_and_wait.call_args
-        assert call_args.kwargs["topic"] == test_settings.kafka_topic_user_verified
-
-        # Verify the message contains the custom timestamp
-        expected_message = custom_event.to_kafka_message()
-        assert call_args.kwargs["key"] == expected_message["key"]
-        assert call_args.kwargs["value"] == expected_message["value"]
+        # The message carries the custom timestamp
+        mock_producer.send.assert_called_once_with(
+            topic=test_settings.kafka_topic_user_verified,
+            **custom_event.kafka_message
+        )
 
     async def test_publish_events_with_different_networks(self, kafka_event_publisher, test_settings):
         """Test publishing events with different network types."""
@@ -329,75 +446,64 @@ class TestKafkaEventPublisher:
             UserVerifiedEvent(user_id="user2", network="bitcoin"),
             UserVerifiedEvent(user_id="user3", network="tron")
         ]
-        mock_producer = AsyncMock(spec=AIOKafkaProducer)
+        mock_producer = _batching_producer()
         kafka_event_publisher._producer = mock_producer
-        mock_futures = [AsyncMock() for _ in events]
-        mock_producer.send.side_effect = mock_futures
+        batch = mock_producer.create_batch.return_value
 
         # Act
         await kafka_event_publisher.publish_batch(events)
 
         # Assert
-        assert mock_producer.send.call_count == 3
-        for event in events:
-            expected_message = event.to_kafka_message()
-            mock_producer.send.assert_any_call(
-                topic=test_settings.kafka_topic_user_verified,
-                **expected_message
-            )
-
-    async def test_publish_events_with_special_characters_in_user_id(self, kafka_event_publisher, test_settings):
+        assert _message_multiset(call.kwargs for call in batch.append.call_args_list) == _message_multiset(
+            {"timestamp": None, **event.kafka_message} for event in events
+        )
+
+    async def test_publish_events_with_special_characters_in_user_id(self, kafka_event_publisher, test_settings, fake_producer):
         """Test publishing events with special characters in user_id."""
         # Arrange
         special_user_event = UserVerifiedEvent(
             user_id="user@domain.com",
             network="ethereum"
         )
-        mock_producer = AsyncMock(spec=AIOKafkaProducer)
+        mock_producer = fake_producer
         kafka_event_publisher._producer = mock_producer
 
         # Act
         await kafka_event_publisher.publish(special_user_event)
 
         # Assert
-        call_args = mock_producer.send_and_wait.call_args
-        expected_message = special_user_event.to_kafka_message()
-        assert call_args.kwargs["key"] == expected_message["key"]
-        assert call_args.kwargs["value"] == expected_message["value"]
+        mock_producer.send.assert_called_once_with(
+            topic=test_settings.kafka_topic_user_verified,
+            **special_user_event.kafka_message
+        )
 
-    async def test_concurrent_publish_operations(self, kafka_event_publisher, multiple_user_verified_events):
+    async def test_concurrent_publish_operations(self, kafka_event_publisher, multiple_user_verified_events, fake_producer):
         """Test concurrent publish operations work correctly."""
         # Arrange
-        mock_producer = AsyncMock(spec=AIOKafkaProducer)
+        mock_producer = fake_producer
         kafka_event_publisher._producer = mock_producer
 
         # Act
-        tasks = [
-            kafka_event_publisher.publish(event)
-            for event in multiple_user_verified_events
-        ]
-        await asyncio.gather(*tasks)
+        async with asyncio.TaskGroup() as task_group:
+            for event in multiple_user_verified_events:
+                task_group.create_task(kafka_event_publisher.publish(event))
 
         # Assert
-        assert mock_producer.send_and_wait.call_count == len(multiple_user_verified_events)
+        assert mock_producer.send.call_count == len(multiple_user_verified_events)
 
-    async def test_serializer_functions_work_correctly(self, kafka_event_publisher):
+    async def test_serializer_functions_work_correctly(self, kafka_event_publisher, mock_producer_class):
         """Test that the serializer functions work as expected."""
-        # Arrange
-        with patch("user_verification_service.src.infrastructure.kafka.producer.AIOKafkaProducer") as mock_producer_class:
-            mock_producer = AsyncMock(spec=AIOKafkaProducer)
-            mock_producer_class.return_value = mock_producer
-
-            # Act
-            await kafka_event_publisher.get_producer()
-
-            # Assert
-            call_args = mock_producer_class.call_args
-            value_serializer = call_args.kwargs["value_serializer"]
-            key_serializer = call_args.kwargs["key_serializer"]
-
-            # Test serializers with different data types
-            assert value_serializer("string") == "string"
-            assert value_serializer(b"bytes") == b"bytes"
-            assert key_serializer("key") == "key"
-            assert key_serializer(b"key_bytes") == b"key_bytes"
+        # Act
+        await kafka_event_publisher.get_producer()
+
+        # Assert
+        call_args = mock_producer_class.call_args
+        value_serializer = call_args.kwargs["value_serializer"]
+        key_serializer = call_args.kwargs["key_serializer"]
+
+        # Test serializers with different data types
+        assert value_serializer("string") == b"string"
+        assert value_serializer(b"bytes") == b"bytes"
+        assert value_serializer({"a": 1}) == b'{"a":1}'
+        assert key_serializer("key") == "key"
+        assert key_serializer(b"key_bytes") == b"key_bytes"
@@ -1,12 +1,49 @@
-from datetime import datetime
-from unittest.mock import AsyncMock, MagicMock
-from uuid import uuid4
+import dataclasses
+from datetime import UTC, datetime
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
 
 import pytest
+from sqlalchemy.dialects import postgresql
 from user_verification_service.src.domain.models.verification import NetworkType, UserVerification, VerificationStatus
 from user_verification_service.src.infrastructure.database.models import VerificationModel
 from user_verification_service.src.infrastructure.repositories.verification_repository import VerificationRepository
 
+_CREATED_AT = datetime(2024, 1, 1, tzinfo=UTC)
+_MODEL_FIELDS = {
+    "user_id": "test_user",
+    "network": "ethereum",
+    "document_hash": "hash123",
+    "status": "pending",
+    "verified_at": None,
+    "created_at": _CREATED_AT,
+    "version": 1
+}
+
+
+def _verification_model(**overrides):
+    """Build a VerificationModel from the shared column values, overriding only what a test varies."""
+    return VerificationModel(**{**_MODEL_FIELDS, **overrides})
+
+
+def _exec_result(value):
+    """Build a stand-in for the Result session.execute returns, yielding value from scalar_one_or_none."""
+    return SimpleNamespace(scalar_one_or_none=lambda: value)
+
+
+_INSERTED_COLUMNS = ("user_id", "network", "document_hash", "status", "verified_at", "created_at")
+
+
+@pytest.fixture
+def save_mock_session(mock_async_session, expected_id):
+    """Wires session.execute to answer the save upsert with the inserted row, stored under expected_id."""
+    async def _returning(stmt):
+        params = stmt.compile().params
+        return _exec_result(VerificationModel(id=expected_id, version=1, **{c: params[c] for c in _INSERTED_COLUMNS}))
+
+    mock_async_session.execute = AsyncMock(side_effect=_returning)
+    return mock_async_session
+
 
 class TestVerificationRepository:
     """Test cases for VerificationRepository."""
@@ -19,17 +56,8 @@ class TestVerificationRepository:
         # Assert
         assert repository.session == mock_async_session
 
-    async def test_save_verification_successfully(self, verification_repository, mock_async_session, valid_user_verification):
+    async def test_save_verification_successfully(self, verification_repository, save_mock_session, valid_user_verification, expected_id):
         """Test saving a new verification to database."""
-        # Arrange
-        expected_id = uuid4()
-
-        def mock_add(db_verification):
-            db_verification.id = expected_id
-
-        mock_async_session.add = MagicMock(side_effect=mock_add)
-        mock_async_session.flush = AsyncMock()
-
         # Act
         result = await verification_repository.save(valid_user_verification)
 
@@ -38,72 +66,82 @@ class TestVerificationRepository:
         assert result.user_id == valid_user_verification.user_id
         assert result.network == valid_user_verification.network
         assert result.document_hash == valid_user_verification.document_hash
-        mock_async_session.add.assert_called_once()
-        mock_async_session.flush.assert_called_once()
+        save_mock_session.execute.assert_called_once()
 
-    async def test_save_verification_creates_correct_database_model(self, verification_repository, mock_async_session, valid_user_verification):
+    async def test_save_verification_creates_correct_database_model(self, verification_repository, save_mock_session, valid_user_verification, expected_id):
         """Test that save creates VerificationModel with correct attributes."""
-        # Arrange
-        expected_id = uuid4()
-
-        def mock_add(db_verification):
-            db_verification.id = expected_id
-
-        mock_async_session.add = MagicMock(side_effect=mock_add)
-        mock_async_session.flush = AsyncMock()
-
         # Act
         await verification_repository.save(valid_user_verification)
 
         # Assert
-        mock_async_session.add.assert_called_once()
-        added_model = mock_async_session.add.call_args[0][0]
-        assert isinstance(added_model, VerificationModel)
-        assert added_model.user_id == valid_user_verification.user_id
-        assert added_model.network == valid_user_verification.network.value
-        assert added_model.document_hash == valid_user_verification.document_hash
-        assert added_model.status == valid_user_verification.status.value
-        assert added_model.verified_at == valid_user_verification.verified_at
-        assert added_model.created_at == valid_user_verification.created_at
-
-    async def test_save_verification_with_verified_status(self, verification_repository, mock_async_session, valid_user_verification):
+        save_mock_session.execute.assert_called_once()
+        stmt = save_mock_session.execute.call_args[0][0]
+        inserted = stmt.compile().params
+        assert stmt.table.name == VerificationModel.__tablename__
+        assert inserted["user_id"] == valid_user_verification.user_id
+        assert inserted["network"] == valid_user_verification.network.value
+        assert inserted["document_hash"] == valid_user_verification.document_hash
+        assert inserted["status"] == valid_user_verification.status.value
+        assert inserted["verified_at"] == valid_user_verification.verified_at
+        assert inserted["created_at"] == valid_user_verification.created_at
+
+    async def test_save_verification_with_verified_status(self, verification_repository, save_mock_session, valid_user_verification, expected_id):
         """Test saving verification with verified status."""
         # Arrange
         valid_user_verification.verify()
-        expected_id = uuid4()
-
-        def mock_add(db_verification):
-            db_verification.id = expected_id
-
-        mock_async_session.add = MagicMock(side_effect=mock_add)
-        mock_async_session.flush = AsyncMock()
 
         # Act
         result = await verification_repository.save(valid_user_verification)
 
         # Assert
-        added_model = mock_async_session.add.call_args[0][0]
-        assert added_model.status == VerificationStatus.VERIFIED.value
-        assert added_model.verified_at == valid_user_verification.verified_at
+        inserted = save_mock_session.execute.call_args[0][0].compile().params
+        assert inserted["status"] == VerificationStatus.VERIFIED.value
+        assert inserted["verified_at"] == valid_user_verification.verified_at
         assert result.status == VerificationStatus.VERIFIED
         assert result.id == expected_id
 
-    async def test_save_verification_database_error_propagates(self, verification_repository, mock_async_session, valid_user_verification):
-        """Test that database errors during save are propagated."""
+    @pytest.mark.parametrize("call", [
+        lambda repository, verification: repository.save(verification),
+        lambda repository, verification: repository.get_by_user_and_network("test_user", "ethereum"),
+        lambda repository, verification: repository.update_status(verification.id, VerificationStatus.VERIFIED)
+    ], ids=["save", "get_by_user_and_network", "update_status"])
+    async def test_database_error_propagates(self, verification_repository, mock_async_session, verification_with_id, call):
+        """Test that database errors raised by execute are propagated."""
         # Arrange
-        mock_async_session.add = MagicMock()
-        mock_async_session.flush = AsyncMock(side_effect=Exception("Database error"))
+        mock_async_session.execute = AsyncMock(side_effect=Exception("Database error"))
 
         # Act & Assert
         with pytest.raises(Exception, match="Database error"):
-            await verification_repository.save(valid_user_verification)
+            await call(verification_repository, verification_with_id)
+
+    async def test_save_verification_upserts_on_user_and_network(self, verification_repository, save_mock_session, valid_user_verification):
+        """Test that save resolves (user_id, network) conflicts without overwriting verified rows."""
+        # Act
+        await verification_repository.save(valid_user_verification)
+
+        # Assert
+        sql = str(save_mock_session.execute.call_args[0][0].compile(dialect=postgresql.dialect()))
+        assert "ON CONFLICT (user_id, network) DO UPDATE" in sql
+        assert "WHERE verifications.status !=" in sql
+        assert "RETURNING" in sql
+
+    async def test_save_verification_returns_existing_verified_row_on_conflict(self, verification_repository, mock_async_session, valid_user_verification, verified_verification_model):
+        """Test that a skipped conflict update falls back to the stored verified row."""
+        # Arrange
+        mock_async_session.execute = AsyncMock(side_effect=[_exec_result(None), _exec_result(verified_verification_model)])
+
+        # Act
+        result = await verification_repository.save(valid_user_verification)
+
+        # Assert
+        assert result.id == verified_verification_model.id
+        assert result.status == VerificationStatus.VERIFIED
+        assert mock_async_session.execute.call_count == 2
 
     async def test_get_by_user_and_network_found(self, verification_repository, mock_async_session, verification_model):
         """Test retrieving existing verification by user and network."""
         # Arrange
-        mock_result = MagicMock()
-        mock_result.scalar_one_or_none.return_value = verification_model
-        mock_async_session.execute = AsyncMock(return_value=mock_result)
+        mock_async_session.execute = AsyncMock(return_value=_exec_result(verification_model))
 
         # Act
         result = await verification_repository.get_by_user_and_network("test_user_123", "ethereum")
@@ -119,9 +157,7 @@ class TestVerificationRepository:
     async def test_get_by_user_and_network_not_found(self, verification_repository, mock_async_session):
         """Test retrieving non-existent verification returns None."""
         # Arrange
-        mock_result = MagicMock()
-        mock_result.scalar_one_or_none.return_value = None
-        mock_async_session.execute = AsyncMock(return_value=mock_result)
+        mock_async_session.execute = AsyncMock(return_value=_exec_result(None))
 
         # Act
         result = await verification_repository.get_by_user_and_network("nonexistent_user", "ethereum")
@@ -133,9 +169,7 @@ class TestVerificationRepository:
     async def test_get_by_user_and_network_query_structure(self, verification_repository, mock_async_session):
         """Test that get_by_user_and_network constructs correct SQL query."""
         # Arrange
-        mock_result = MagicMock()
-        mock_result.scalar_one_or_none.return_value = None
-        mock_async_session.execute = AsyncMock(return_value=mock_result)
+        mock_async_session.execute = AsyncMock(return_value=_exec_result(None))
 
         # Act
         await verification_repository.get_by_user_and_network("test_user", "bitcoin")
@@ -145,19 +179,10 @@ class TestVerificationRepository:
         call_args = mock_async_session.execute.call_args[0][0]
         assert hasattr(call_args, "whereclause")
 
-    async def test_get_by_user_and_network_database_error_propagates(self, verification_repository, mock_async_session):
-        """Test that database errors during get are propagated."""
-        # Arrange
-        mock_async_session.execute = AsyncMock(side_effect=Exception("Database connection error"))
-
-        # Act & Assert
-        with pytest.raises(Exception, match="Database connection error"):
-            await verification_repository.get_by_user_and_network("test_user", "ethereum")
-
-    async def test_update_status_successfully(self, verification_repository, mock_async_session):
+    async def test_update_status_successfully(self, verification_repository, mock_async_session, uid_factory):
         """Test updating verification status successfully."""
         # Arrange
-        verification_id = uuid4()
+        verification_id = uid_factory()
         new_status = VerificationStatus.VERIFIED
         mock_async_session.execute = AsyncMock()
 
@@ -169,29 +194,18 @@ class TestVerificationRepository:
         call_args = mock_async_session.execute.call_args[0][0]
         assert hasattr(call_args, "table")
 
-    async def test_update_status_with_different_statuses(self, verification_repository, mock_async_session):
+    @pytest.mark.parametrize("status", list(VerificationStatus))
+    async def test_update_status_with_different_statuses(self, verification_repository, mock_async_session, uid_factory, status):
         """Test updating verification with different status values."""
         # Arrange
-        verification_id = uuid4()
-        statuses = [VerificationStatus.PENDING, VerificationStatus.VERIFIED, VerificationStatus.FAILED]
+        verification_id = uid_factory()
         mock_async_session.execute = AsyncMock()
 
-        for status in statuses:
-            # Act
-            await verification_repository.update_status(verification_id, status)
-
-            # Assert
-            mock_async_session.execute.assert_called()
-
-    async def test_update_status_database_error_propagates(self, verification_repository, mock_async_session):
-        """Test that database errors during update are propagated."""
-        # Arrange
-        verification_id = uuid4()
-        mock_async_session.execute = AsyncMock(side_effect=Exception("Update failed"))
+        # Act
+        await verification_repository.update_status(verification_id, status)
 
-        # Act & Assert
-        with pytest.raises(Exception, match="Update failed"):
-            await verification_repository.update_status(verification_id, VerificationStatus.VERIFIED)
+        # Assert
+        mock_async_session.execute.assert_called_once()
 
     def test_to_domain_conversion_complete_model(self, verification_repository, verified_verification_model):
         """Test converting complete database model to domain model."""
@@ -229,65 +243,34 @@ class TestVerificationRepository:
         assert result.verified_at is None
         assert result.created_at == verification_model.created_at
 
-    def test_to_domain_conversion_all_network_types(self, verification_repository):
+    @pytest.mark.parametrize("network", [n.value for n in NetworkType])
+    def test_to_domain_conversion_all_network_types(self, verification_repository, uid_factory, network):
         """Test converting models with different network types."""
         # Arrange
-        networks = ["ethereum", "bitcoin", "tron"]
-
-        for network in networks:
-            db_model = VerificationModel(
-                id=uuid4(),
-                user_id="test_user",
-                network=network,
-                document_hash="hash123",
-                status="pending",
-                verified_at=None,
-                created_at=datetime.now(),
-                version=1
-            )
-
-            # Act
-            result = verification_repository._to_domain(db_model)
-
-            # Assert
-            assert result.network == NetworkType(network)
-
-    def test_to_domain_conversion_all_status_types(self, verification_repository):
+        db_model = _verification_model(id=uid_factory(), network=network)
+
+        # Act
+        result = verification_repository._to_domain(db_model)
+
+        # Assert
+        assert result.network == NetworkType(network)
+
+    @pytest.mark.parametrize("status", [s.value for s in VerificationStatus])
+    def test_to_domain_conversion_all_status_types(self, verification_repository, uid_factory, status):
         """Test converting models with different status types."""
         # Arrange
-        statuses = ["pending", "verified", "failed"]
-
-        for status in statuses:
-            db_model = VerificationModel(
-                id=uuid4(),
-                user_id="test_user",
-                network="ethereum",
-                document_hash="hash123",
-                status=status,
-                verified_at=None,
-                created_at=datetime.now(),
-                version=1
-            )
-
-            # Act
-            result = verification_repository._to_domain(db_model)
-
-            # Assert
-            assert result.status == VerificationStatus(status)
-
-    def test_to_domain_conversion_with_special_characters(self, verification_repository):
+        db_model = _verification_model(id=uid_factory(), status=status)
+
+        # Act
+        result = verification_repository._to_domain(db_model)
+
+        # Assert
+        assert result.status == VerificationStatus(status)
+
+    def test_to_domain_conversion_with_special_characters(self, verification_repository, uid_factory):
         """Test converting model with special characters in fields."""
         # Arrange
-        db_model = VerificationModel(
-            id=uuid4(),
-            user_id="user@example.com",
-            network="ethereum",
-            document_hash="abc123!@#$%^&*()",
-            status="pending",
-            verified_at=None,
-            created_at=datetime.now(),
-            version=1
-        )
+        db_model = _verification_model(id=uid_factory(), user_id="user@example.com", document_hash="abc123!@#$%^&*()")
 
         # Act
         result = verification_repository._to_domain(db_model)
@@ -299,9 +282,7 @@ class TestVerificationRepository:
     async def test_get_by_user_and_network_with_special_characters(self, verification_repository, mock_async_session):
         """Test retrieving verification with special characters in user_id."""
         # Arrange
-        mock_result = MagicMock()
-        mock_result.scalar_one_or_none.return_value = None
-        mock_async_session.execute = AsyncMock(return_value=mock_result)
+        mock_async_session.execute = AsyncMock(return_value=_exec_result(None))
 
         # Act
         result = await verification_repository.get_by_user_and_network("user@domain.com", "ethereum")
@@ -310,37 +291,19 @@ class TestVerificationRepository:
         assert result is None
         mock_async_session.execute.assert_called_once()
 
-    async def test_save_verification_preserves_original_object(self, verification_repository, mock_async_session, valid_user_verification):
+    async def test_save_verification_preserves_original_object(self, verification_repository, save_mock_session, valid_user_verification, expected_id):
         """Test that save operation doesn't modify original verification object except for ID."""
         # Arrange
-        original_user_id = valid_user_verification.user_id
-        original_network = valid_user_verification.network
-        original_document_hash = valid_user_verification.document_hash
-        original_status = valid_user_verification.status
-        original_verified_at = valid_user_verification.verified_at
-        original_created_at = valid_user_verification.created_at
-
-        expected_id = uuid4()
-
-        def mock_add(db_verification):
-            db_verification.id = expected_id
-
-        mock_async_session.add = MagicMock(side_effect=mock_add)
-        mock_async_session.flush = AsyncMock()
+        original = dataclasses.replace(valid_user_verification)
 
         # Act
         result = await verification_repository.save(valid_user_verification)
 
         # Assert
-        assert valid_user_verification.user_id == original_user_id
-        assert valid_user_verification.network == original_network
-        assert valid_user_verification.document_hash == original_document_hash
-        assert valid_user_verification.status == original_status
-        assert valid_user_verification.verified_at == original_verified_at
-        assert valid_user_verification.created_at == original_created_at
+        assert valid_user_verification == original
         assert result.id == expected_id
 
-    async def test_repository_handles_empty_strings(self, verification_repository, mock_async_session):
+    async def test_repository_handles_empty_strings(self, verification_repository, save_mock_session, expected_id):
         """Test repository handles empty string values correctly."""
         # Arrange
         verification = UserVerification(
@@ -348,21 +311,14 @@ class TestVerificationRepository:
             network=NetworkType.ETHEREUM,
             document_hash=""
         )
-        expected_id = uuid4()
-
-        def mock_add(db_verification):
-            db_verification.id = expected_id
-
-        mock_async_session.add = MagicMock(side_effect=mock_add)
-        mock_async_session.flush = AsyncMock()
 
         # Act
         result = await verification_repository.save(verification)
 
         # Assert
-        added_model = mock_async_session.add.call_args[0][0]
-        assert added_model.user_id == ""
-        assert added_model.document_hash == ""
+        inserted = save_mock_session.execute.call_args[0][0].compile().params
+        assert inserted["user_id"] == ""
+        assert inserted["document_hash"] == ""
         assert result.user_id == ""
         assert result.document_hash == ""
         assert result.id == expected_id
@@ -1,30 +1,36 @@
 import asyncio
 import base64
 import hashlib
-from unittest.mock import patch
-from uuid import uuid4
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
+from user_verification_service.src.core.exceptions import InvalidDocumentFormatException
+from user_verification_service.src.domain.interfaces.repository import IVerificationRepository
 from user_verification_service.src.domain.models.verification import NetworkType, UserVerification, VerificationStatus
 from user_verification_service.src.domain.schemas.events import UserVerifiedEvent
-from user_verification_service.src.services.verification_service import VerificationService
+from user_verification_service.src.services.verification_service import VerificationService, _decoded_size
+
+
+def _discard_task(coro):
+    """Stand-in for asyncio.create_task that closes the coroutine so it is not reported as never awaited."""
+    coro.close()
+    return MagicMock()
 
 
 class TestVerificationService:
     """Test cases for VerificationService."""
 
-    async def test_verify_user_successful_new_verification(self, verification_service, mock_repository, valid_document_base64):
+    async def test_verify_user_successful_new_verification(self, verification_service, mock_repository, valid_document_base64, uid_factory):
         # Arrange
         user_id = "test_user"
         network = "ethereum"
-        mock_repository.get_by_user_and_network.return_value = None
 
         saved_verification = UserVerification(
             user_id=user_id,
             network=NetworkType.ETHEREUM,
             document_hash=hashlib.sha256(base64.b64decode(valid_document_base64)).hexdigest()
         )
-        saved_verification.id = uuid4()
+        saved_verification.id = uid_factory()
         mock_repository.save.return_value = saved_verification
 
         # Act
@@ -33,17 +39,16 @@ class TestVerificationService:
         # Assert
         assert result.user_id == user_id
         assert result.network == NetworkType.ETHEREUM
-        assert result.status == VerificationStatus.VERIFIED
-        assert result.verified_at is not None
-        mock_repository.get_by_user_and_network.assert_called_once_with(user_id, network)
+        assert result.status == VerificationStatus.PENDING
+        assert result.verified_at is None
         mock_repository.save.assert_called_once()
-        mock_repository.update_status.assert_called_once_with(saved_verification.id, VerificationStatus.VERIFIED)
+        mock_repository.update_status.assert_not_called()
 
     async def test_verify_user_returns_existing_verified_user(self, verification_service, mock_repository, existing_verified_user, valid_document_base64):
         # Arrange
         user_id = "existing_user"
         network = "ethereum"
-        mock_repository.get_by_user_and_network.return_value = existing_verified_user
+        mock_repository.save.return_value = existing_verified_user
 
         # Act
         result = await verification_service.verify_user(user_id, network, valid_document_base64)
@@ -51,22 +56,20 @@ class TestVerificationService:
         # Assert
         assert result == existing_verified_user
         assert result.status == VerificationStatus.VERIFIED
-        mock_repository.get_by_user_and_network.assert_called_once_with(user_id, network)
-        mock_repository.save.assert_not_called()
+        mock_repository.get_by_user_and_network.assert_not_called()
+        mock_repository.save.assert_called_once()
         mock_repository.update_status.assert_not_called()
 
-    async def test_verify_user_processes_existing_pending_user(self, verification_service, mock_repository, existing_pending_user, valid_document_base64):
+    async def test_verify_user_processes_existing_pending_user(self, verification_service, mock_repository, existing_pending_user, valid_document_base64, uid_factory):
         # Arrange
         user_id = "pending_user"
         network = "ethereum"
-        mock_repository.get_by_user_and_network.return_value = existing_pending_user
-
         saved_verification = UserVerification(
             user_id=user_id,
             network=NetworkType.ETHEREUM,
             document_hash=hashlib.sha256(base64.b64decode(valid_document_base64)).hexdigest()
         )
-        saved_verification.id = uuid4()
+        saved_verification.id = uid_factory()
         mock_repository.save.return_value = saved_verification
 
         # Act
@@ -74,44 +77,71 @@ class TestVerificationService:
 
         # Assert
         assert result.user_id == user_id
-        assert result.status == VerificationStatus.VERIFIED
-        mock_repository.get_by_user_and_network.assert_called_once_with(user_id, network)
+        assert result.status == VerificationStatus.PENDING
         mock_repository.save.assert_called_once()
-        mock_repository.update_status.assert_called_once()
+        mock_repository.update_status.assert_not_called()
 
-    async def test_verify_user_document_too_large_raises_error(self, verification_service, test_settings):
+    async def test_verify_user_document_too_large_raises_error(self, verification_service, oversized_document_base64):
         # Arrange
         user_id = "test_user"
         network = "ethereum"
-        large_document = b"x" * (test_settings.max_document_size_mb * 1024 * 1024 + 1)
-        large_document_base64 = base64.b64encode(large_document).decode("utf-8")
 
         # Act & Assert
         with pytest.raises(ValueError, match="Document too large"):
-            await verification_service.verify_user(user_id, network, large_document_base64)
+            await verification_service.verify_user(user_id, network, oversized_document_base64)
+
+    async def test_verify_user_document_too_large_is_rejected_before_decoding(self, verification_service, oversized_document_base64):
+        # Arrange
+        user_id = "test_user"
+        network = "ethereum"
+
+        # Act & Assert
+        with patch("user_verification_service.src.services.verification_service.b64decode") as mock_b64decode:
+            with pytest.raises(ValueError, match="Document too large"):
+                await verification_service.verify_user(user_id, network, oversized_document_base64)
+
+        mock_b64decode.assert_not_called()
 
-    async def test_verify_user_with_empty_document(self, verification_service, mock_repository):
+    @pytest.mark.parametrize("size", range(7))
+    def test_decoded_size_matches_decoded_length(self, size):
+        # Arrange
+        document_base64 = base64.b64encode(b"x" * size).decode("utf-8")
+
+        # Act & Assert
+        assert _decoded_size(document_base64) == size
+
+    async def test_verify_user_with_empty_document(self, verification_service, mock_repository, uid_factory):
         # Arrange
         user_id = "test_user"
         network = "ethereum"
         empty_document_base64 = base64.b64encode(b"").decode("utf-8")
-        mock_repository.get_by_user_and_network.return_value = None
 
         saved_verification = UserVerification(
             user_id=user_id,
             network=NetworkType.ETHEREUM,
             document_hash=hashlib.sha256(b"").hexdigest()
         )
-        saved_verification.id = uuid4()
+        saved_verification.id = uid_factory()
         mock_repository.save.return_value = saved_verification
 
         # Act
         result = await verification_service.verify_user(user_id, network, empty_document_base64)
 
         # Assert
-        assert result.status == VerificationStatus.VERIFIED
+        assert result.status == VerificationStatus.PENDING
         assert result.document_hash == hashlib.sha256(b"").hexdigest()
 
+    async def test_verify_user_invalid_base64_raises_error(self, verification_service, mock_repository):
+        # Arrange
+        user_id = "test_user"
+        network = "ethereum"
+        malformed_document = "A==="
+
+        # Act & Assert
+        with pytest.raises(InvalidDocumentFormatException):
+            await verification_service.verify_user(user_id, network, malformed_document)
+        mock_repository.save.assert_not_called()
+
     async def test_verify_user_invalid_network_raises_error(self, verification_service, valid_document_base64):
         # Arrange
         user_id = "test_user"
@@ -121,11 +151,10 @@ class TestVerificationService:
         with pytest.raises(ValueError):
             await verification_service.verify_user(user_id, invalid_network, valid_document_base64)
 
-    async def test_verify_user_creates_correct_document_hash(self, verification_service, mock_repository, valid_document_base64):
+    async def test_verify_user_creates_correct_document_hash(self, verification_service, mock_repository, valid_document_base64, uid_factory):
         # Arrange
         user_id = "test_user"
         network = "ethereum"
-        mock_repository.get_by_user_and_network.return_value = None
 
         expected_hash = hashlib.sha256(base64.b64decode(valid_document_base64)).hexdigest()
         saved_verification = UserVerification(
@@ -133,7 +162,7 @@ class TestVerificationService:
             network=NetworkType.ETHEREUM,
             document_hash=expected_hash
         )
-        saved_verification.id = uuid4()
+        saved_verification.id = uid_factory()
         mock_repository.save.return_value = saved_verification
 
         # Act
@@ -143,11 +172,10 @@ class TestVerificationService:
         save_call_args = mock_repository.save.call_args[0][0]
         assert save_call_args.document_hash == expected_hash
 
-    async def test_verify_user_handles_different_networks(self, verification_service, mock_repository, valid_document_base64):
+    async def test_verify_user_handles_different_networks(self, verification_service, mock_repository, valid_document_base64, uid_factory):
         # Arrange
         user_id = "test_user"
         networks = ["ethereum", "tron", "bitcoin"]
-        mock_repository.get_by_user_and_network.return_value = None
 
         for network in networks:
             saved_verification = UserVerification(
@@ -155,7 +183,7 @@ class TestVerificationService:
                 network=NetworkType(network),
                 document_hash="test_hash"
             )
-            saved_verification.id = uuid4()
+            saved_verification.id = uid_factory()
             mock_repository.save.return_value = saved_verification
 
             # Act
@@ -168,52 +196,63 @@ class TestVerificationService:
         # Arrange
         user_id = "test_user"
         network = "ethereum"
-        mock_repository.get_by_user_and_network.return_value = None
         mock_repository.save.side_effect = Exception("Database error")
 
         # Act & Assert
         with pytest.raises(Exception, match="Database error"):
             await verification_service.verify_user(user_id, network, valid_document_base64)
 
-    async def test_verify_user_repository_update_failure_propagates(self, verification_service, mock_repository, valid_document_base64):
+    async def test_complete_verification_marks_verified_and_updates_status(self, verification_service, mock_repository, existing_pending_user):
         # Arrange
-        user_id = "test_user"
-        network = "ethereum"
-        mock_repository.get_by_user_and_network.return_value = None
+        # existing_pending_user fixture provides a saved pending verification
 
-        saved_verification = UserVerification(
-            user_id=user_id,
-            network=NetworkType.ETHEREUM,
-            document_hash="test_hash"
-        )
-        saved_verification.id = uuid4()
-        mock_repository.save.return_value = saved_verification
+        # Act
+        with patch("asyncio.create_task", side_effect=_discard_task):
+            result = await verification_service.complete_verification(existing_pending_user)
+
+        # Assert
+        assert result.status == VerificationStatus.VERIFIED
+        assert result.verified_at is not None
+        mock_repository.update_status.assert_called_once_with(existing_pending_user.id, VerificationStatus.VERIFIED)
+
+    async def test_complete_verification_update_failure_propagates(self, verification_service, mock_repository, existing_pending_user):
+        # Arrange
         mock_repository.update_status.side_effect = Exception("Update error")
 
         # Act & Assert
         with pytest.raises(Exception, match="Update error"):
-            await verification_service.verify_user(user_id, network, valid_document_base64)
+            await verification_service.complete_verification(existing_pending_user)
+
+    @patch("asyncio.create_task", side_effect=_discard_task)
+    async def test_complete_verification_creates_event_publishing_task(self, mock_create_task, verification_service, existing_pending_user):
+        # Arrange
+        # existing_pending_user fixture provides a saved pending verification
+
+        # Act
+        await verification_service.complete_verification(existing_pending_user)
+
+        # Assert
+        mock_create_task.assert_called_once()
 
-    @patch("asyncio.create_task")
-    async def test_verify_user_creates_event_publishing_task(self, mock_create_task, verification_service, mock_repository, valid_document_base64):
+    @patch("asyncio.create_task", side_effect=_discard_task)
+    async def test_verify_user_does_not_publish_event(self, mock_create_task, verification_service, mock_repository, valid_document_base64, uid_factory):
         # Arrange
         user_id = "test_user"
         network = "ethereum"
-        mock_repository.get_by_user_and_network.return_value = None
 
         saved_verification = UserVerification(
             user_id=user_id,
             network=NetworkType.ETHEREUM,
             document_hash="test_hash"
         )
-        saved_verification.id = uuid4()
+        saved_verification.id = uid_factory()
         mock_repository.save.return_value = saved_verification
 
         # Act
         await verification_service.verify_user(user_id, network, valid_document_base64)
 
         # Assert
-        mock_create_task.assert_called_once()
+        mock_create_task.assert_not_called()
 
     async def test_publish_event_successful_first_attempt(self, verification_service, mock_event_publisher):
         # Arrange
@@ -234,6 +273,17 @@ class TestVerificationService:
         assert call_args.user_id == "test_user"
         assert call_args.network == "ethereum"
 
+    async def test_wait_for_publishes_drains_in_flight_publish_tasks(self, verification_service, mock_repository, mock_event_publisher, existing_pending_user):
+        # Arrange
+        await verification_service.complete_verification(existing_pending_user)
+
+        # Act
+        await verification_service.wait_for_publishes()
+
+        # Assert
+        mock_event_publisher.publish.assert_called_once()
+        assert not verification_service._publish_tasks
+
     async def test_publish_event_retry_on_failure_then_success(self, verification_service, mock_event_publisher, mock_logger):
         # Arrange
         verification = UserVerification(
@@ -256,8 +306,9 @@ class TestVerificationService:
         assert mock_event_publisher.publish.call_count == 2
         mock_sleep.assert_called_once_with(1)  # 2^0 = 1
 
-    async def test_publish_event_all_attempts_fail_logs_error(self, verification_service, mock_event_publisher, mock_logger):
+    async def test_publish_event_all_attempts_fail_logs_error(self, verification_service, mock_event_publisher, recording_logger):
         # Arrange
+        verification_service.logger = recording_logger
         verification = UserVerification(
             user_id="test_user",
             network=NetworkType.ETHEREUM,
@@ -275,8 +326,8 @@ class TestVerificationService:
         assert mock_event_publisher.publish.call_count == 3
         mock_sleep.assert_any_call(1)  # 2^0 = 1
         mock_sleep.assert_any_call(2)  # 2^1 = 2
-        mock_logger.error.assert_called_once()
-        assert "Failed to publish event after 3 attempts" in mock_logger.error.call_args[0][0]
+        recording_logger.error.assert_called_once()
+        assert "Failed to publish event after 3 attempts" in recording_logger.error.call_args[0][0]
 
     async def test_publish_event_retry_timing_exponential_backoff(self, verification_service, mock_event_publisher):
         # Arrange
@@ -302,18 +353,17 @@ class TestVerificationService:
         mock_sleep.assert_any_call(2)  # 2^1 = 2
         assert mock_sleep.call_count == 2
 
-    async def test_semaphore_limits_concurrent_verifications(self, verification_service, mock_repository, valid_document_base64):
+    async def test_semaphore_limits_concurrent_verifications(self, verification_service, mock_repository, valid_document_base64, uid_factory):
         # Arrange
         user_id = "test_user"
         network = "ethereum"
-        mock_repository.get_by_user_and_network.return_value = None
 
         saved_verification = UserVerification(
             user_id=user_id,
             network=NetworkType.ETHEREUM,
             document_hash="test_hash"
         )
-        saved_verification.id = uuid4()
+        saved_verification.id = uid_factory()
         mock_repository.save.return_value = saved_verification
 
         # Act
@@ -329,7 +379,7 @@ class TestVerificationService:
         # Assert
         assert len(results) == 15
         for result in results:
-            assert result.status == VerificationStatus.VERIFIED
+            assert result.status == VerificationStatus.PENDING
 
     async def test_verification_service_initialization(self, mock_repository, mock_event_publisher, test_settings, mock_logger):
         # Arrange & Act
@@ -347,18 +397,31 @@ class TestVerificationService:
         assert service.logger == mock_logger
         assert service._semaphore._value == test_settings.max_concurrent_verifications
 
-    async def test_verify_user_with_empty_user_id(self, verification_service, mock_repository, valid_document_base64):
+    async def test_with_repository_shares_semaphore_and_publish_tasks(self, verification_service, mock_repository):
+        # Arrange
+        request_repository = AsyncMock(spec=IVerificationRepository)
+
+        # Act
+        bound = verification_service.with_repository(request_repository)
+
+        # Assert
+        assert bound is not verification_service
+        assert bound.repository is request_repository
+        assert verification_service.repository is mock_repository
+        assert bound._semaphore is verification_service._semaphore
+        assert bound._publish_tasks is verification_service._publish_tasks
+
+    async def test_verify_user_with_empty_user_id(self, verification_service, mock_repository, valid_document_base64, uid_factory):
         # Arrange
         user_id = ""
         network = "ethereum"
-        mock_repository.get_by_user_and_network.return_value = None
 
         saved_verification = UserVerification(
             user_id=user_id,
             network=NetworkType.ETHEREUM,
             document_hash="test_hash"
         )
-        saved_verification.id = uuid4()
+        saved_verification.id = uid_factory()
         mock_repository.save.return_value = saved_verification
 
         # Act
@@ -366,26 +429,25 @@ class TestVerificationService:
 
         # Assert
         assert result.user_id == ""
-        assert result.status == VerificationStatus.VERIFIED
+        assert result.status == VerificationStatus.PENDING
 
-    async def test_verify_user_with_minimal_document(self, verification_service, mock_repository):
+    async def test_verify_user_with_minimal_document(self, verification_service, mock_repository, uid_factory):
         # Arrange
         user_id = "test_user"
         network = "ethereum"
         minimal_document = base64.b64encode(b"a").decode("utf-8")
-        mock_repository.get_by_user_and_network.return_value = None
 
         saved_verification = UserVerification(
             user_id=user_id,
             network=NetworkType.ETHEREUM,
             document_hash=hashlib.sha256(b"a").hexdigest()
         )
-        saved_verification.id = uuid4()
+        saved_verification.id = uid_factory()
         mock_repository.save.return_value = saved_verification
 
         # Act
         result = await verification_service.verify_user(user_id, network, minimal_document)
 
         # Assert
-        assert result.status == VerificationStatus.VERIFIED
+        assert result.status == VerificationStatus.PENDING
         assert result.document_hash == hashlib.sha256(b"a").hexdigest()
@@ -1,9 +1,20 @@
-import json
-
 from starlette.requests import Request
-from starlette.responses import JSONResponse, Response
+from starlette.responses import Response
 from wallet_service.infrastructure.cache.cache_service import CacheService
 
+# Regenerated for every response rather than replayed from the cache
+_UNCACHED_HEADERS = frozenset({b"content-length", b"content-type", b"date", b"server"})
+
+
+def _json_response(
+        body: bytes, status_code: int, raw_headers: list[tuple[bytes, bytes]], cache_status: str
+) -> Response:
+    """Build a JSON response over cached raw headers without a dict round-trip."""
+    response = Response(content=body, status_code=status_code, media_type="application/json")
+    response.raw_headers.extend(raw_headers)
+    response.headers["X-Cache"] = cache_status
+    return response
+
 
 class CacheMiddleware:
     """HTTP caching middleware for GET requests."""
@@ -19,40 +30,32 @@ class CacheMiddleware:
         cache_key = f"http:{request.url.path}:{request.url.query}"
         cached_response = await self.cache.get(cache_key)
         if cached_response:
-            return JSONResponse(
-                content=cached_response["content"],
-                status_code=cached_response["status_code"],
-                headers={
-                    **cached_response["headers"],
-                    "X-Cache": "HIT"
-                }
+            return _json_response(
+                cached_response["body"],
+                cached_response["status_code"],
+                cached_response["headers"],
+                "HIT"
             )
 
         response = await call_next(request)
 
         if response.status_code == 200:
-            body = b""
+            chunks: list[bytes] = []
             async for chunk in response.body_iterator:
-                body += chunk
+                chunks.append(chunk)
+            body = b"".join(chunks)
+            headers = [(name, value) for name, value in response.raw_headers if name not in _UNCACHED_HEADERS]
 
             await self.cache.set(
                 cache_key,
                 {
-                    "content": json.loads(body),
+                    "body": body,
                     "status_code": response.status_code,
-                    "headers": dict(response.headers)
+                    "headers": headers
                 },
                 ttl=300
             )
 
-            return Response(
-                content=body,
-                status_code=response.status_code,
-                headers={
-                    **response.headers,
-                    "X-Cache": "MISS"
-                },
-                media_type="application/json"
-            )
+            return _json_response(body, response.status_code, headers, "MISS")
 
         return response
@@ -1,3 +1,5 @@
+import logging
+
 from fastapi import APIRouter, Depends, HTTPException, Query, Request
 from sqlalchemy import text
 from wallet_service.api.dependencies.utils import (
@@ -6,13 +8,15 @@ from wallet_service.api.dependencies.utils import (
     get_request_id,
     get_wallet_service,
 )
-from wallet_service.core.logger import Logger
+from wallet_service.core.logger import get_logger
 from wallet_service.domain.schemas.responses import WalletResponse
 from wallet_service.infrastructure.cache.cache_service import CacheService
 from wallet_service.services.wallet_service import WalletService
 
 router = APIRouter(tags=["wallet"])
-logger = Logger()
+logger = get_logger()
+
+_ALLOWED_NETWORKS: frozenset[str] = frozenset({"ethereum", "tron", "bitcoin"})
 
 
 @router.get(
@@ -31,20 +35,22 @@ async def get_wallet(
         request_id: str = Depends(get_request_id)
 ) -> WalletResponse:
     """Get wallet address for user on specified network."""
-    logger.info(
-        "Wallet lookup request",
-        extra={
-            "request_id": request_id,
-            "user_id": user_id,
-            "network": network
-        }
-    )
-
-    if network.lower() not in ["ethereum", "tron", "bitcoin"]:
+    if logger.is_enabled_for(logging.INFO):
+        logger.info(
+            "Wallet lookup request",
+            extra={
+                "request_id": request_id,
+                "user_id": user_id,
+                "network": network
+            }
+        )
+
+    network_lc = network.lower()
+    if network_lc not in _ALLOWED_NETWORKS:
         raise HTTPException(status_code=400, detail=f"Invalid network: {network}")
 
     try:
-        wallet = await wallet_service.get_wallet(user_id=user_id, network=network.lower())
+        wallet = await wallet_service.get_wallet(user_id=user_id, network=network_lc)
 
         if not wallet:
             raise HTTPException(status_code=404, detail="Wallet not found")
@@ -60,7 +66,8 @@ async def get_wallet(
         raise
     except Exception as e:
         logger.error(
-            f"Failed to get wallet: {e}",
+            "Failed to get wallet: %s",
+            e,
             extra={
                 "request_id": request_id,
                 "user_id": user_id,
@@ -90,7 +97,8 @@ async def health_check(request: Request, db_session=Depends(get_db_session), cac
         health_status["checks"]["cache"] = "failed"
         health_status["status"] = "unhealthy"
 
-    if hasattr(request.app.state, "kafka_consumer"):
-        health_status["checks"]["kafka_consumer"] = ("ok" if request.app.state.kafka_consumer._running else "failed")
+    kafka_consumer = request.app.state.kafka_consumer
+    if kafka_consumer is not None:
+        health_status["checks"]["kafka_consumer"] = ("ok" if kafka_consumer._running else "failed")
 
     return health_status
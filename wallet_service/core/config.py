@@ -1,3 +1,4 @@
+from functools import cached_property, lru_cache
 
 from pydantic_settings import BaseSettings
 from wallet_service.core.security import decrypt_mnemonic
@@ -57,6 +58,7 @@ class Settings(BaseSettings):
     derivation_path_cache_size: int = 1000
     batch_processing_size: int = 10
     consumer_poll_timeout_ms: int = 1000
+    last_accessed_flush_seconds: int = 30
 
     # Crypto settings
     ethereum_derivation_path: str = "m/44'/60'/0'/0"
@@ -71,19 +73,19 @@ class Settings(BaseSettings):
             raise ValueError("Invalid mnemonic length")
         return v
 
-    @property
+    @cached_property
     def decrypted_mnemonic(self) -> str:
         """Get decrypted mnemonic (cached)"""
-        if not hasattr(self, "_decrypted_mnemonic"):
-            if self.mnemonic_encrypted and self.encryption_key:
-                self._decrypted_mnemonic = decrypt_mnemonic(
-                    self.mnemonic,
-                    self.encryption_key
-                )
-            else:
-                self._decrypted_mnemonic = self.mnemonic
-        return self._decrypted_mnemonic
+        if self.mnemonic_encrypted and self.encryption_key:
+            return decrypt_mnemonic(self.mnemonic, self.encryption_key)
+        return self.mnemonic
 
     class Config:
         env_file = ".env"
         case_sensitive = False
+
+
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Return the process-wide Settings instance, parsed from the environment once."""
+    return Settings()
@@ -1,5 +1,9 @@
+import atexit
 import logging
+import queue
 import sys
+from functools import lru_cache
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
 
 
@@ -26,11 +30,22 @@ class Logger:
             console_handler.setFormatter(formatter)
             self._logger.addHandler(console_handler)
 
-            # File handler for errors only
+            # File handler for errors only, fed through a queue so the event loop never blocks on disk writes
             error_file_handler = logging.FileHandler(error_log_file)
             error_file_handler.setLevel(logging.ERROR)
             error_file_handler.setFormatter(formatter)
-            self._logger.addHandler(error_file_handler)
+            error_queue = queue.SimpleQueue()
+            error_queue_handler = QueueHandler(error_queue)
+            error_queue_handler.setLevel(logging.ERROR)
+            self._logger.addHandler(error_queue_handler)
+
+            listener = QueueListener(error_queue, error_file_handler, respect_handler_level=True)
+            listener.start()
+            atexit.register(listener.stop)
+
+    def is_enabled_for(self, level: int) -> bool:
+        """Check whether a message at this level would be emitted."""
+        return self._logger.isEnabledFor(level)
 
     def info(self, msg, *args, **kwargs) -> None:
         """Log an info message."""
@@ -52,3 +67,9 @@ class Logger:
     def exception(self, msg, *args, **kwargs) -> None:
         """Log an exception message."""
         self._logger.exception(msg, *args, **kwargs)
+
+
+@lru_cache(maxsize=1)
+def get_logger() -> Logger:
+    """Return the process-wide Logger instance, configured once."""
+    return Logger()
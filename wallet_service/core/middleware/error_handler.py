@@ -4,9 +4,9 @@ from uuid import uuid4
 from starlette.middleware.base import BaseHTTPMiddleware
 from starlette.requests import Request
 from starlette.responses import JSONResponse
-from user_verification_service.src.core.logger import Logger
+from wallet_service.core.logger import get_logger
 
-logger = Logger()
+logger = get_logger()
 
 # Context variable for request ID
 request_id_var: contextvars.ContextVar[str] = contextvars.ContextVar("request_id")
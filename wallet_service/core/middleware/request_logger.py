@@ -2,9 +2,9 @@ import time
 
 from starlette.middleware.base import BaseHTTPMiddleware
 from starlette.requests import Request
-from user_verification_service.src.core.logger import Logger
+from wallet_service.core.logger import get_logger
 
-logger = Logger()
+logger = get_logger()
 
 
 class RequestLoggerMiddleware(BaseHTTPMiddleware):
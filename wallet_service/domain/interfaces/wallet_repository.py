@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from datetime import datetime
 from uuid import UUID
 
 from wallet_service.domain.models.wallet import Wallet
@@ -26,3 +27,7 @@ class IWalletRepository(ABC):
     @abstractmethod
     async def update_last_accessed(self, wallet_id: UUID) -> None:
         """Update last accessed timestamp"""
+
+    @abstractmethod
+    async def bulk_update_last_accessed(self, accessed: dict[UUID, datetime]) -> None:
+        """Update last accessed timestamps for many wallets"""
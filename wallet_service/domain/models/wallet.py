@@ -13,7 +13,7 @@ class NetworkType(str, Enum):
     BITCOIN = "bitcoin"
 
 
-@dataclass
+@dataclass(slots=True)
 class Wallet:
     """Domain model for wallet"""
 
@@ -25,25 +25,26 @@ class Wallet:
     created_at: datetime = field(default_factory=datetime.now)
     last_accessed_at: datetime | None = None
 
-    _address_checksum: str | None = None
     _derivation_path: str | None = None
 
     def __post_init__(self):
         """Validate wallet on creation"""
         self._validate_address()
-        self._generate_checksum()
 
     def _validate_address(self):
         """Validate address format based on network"""
-        validators = {
-            NetworkType.ETHEREUM: self._validate_ethereum_address,
-            NetworkType.TRON: self._validate_tron_address,
-            NetworkType.BITCOIN: self._validate_bitcoin_address
-        }
+        network = self.network
+        if network is NetworkType.ETHEREUM:
+            valid = self._validate_ethereum_address()
+        elif network is NetworkType.TRON:
+            valid = self._validate_tron_address()
+        elif network is NetworkType.BITCOIN:
+            valid = self._validate_bitcoin_address()
+        else:
+            return
 
-        validator = validators.get(self.network)
-        if validator and not validator():
-            raise ValueError(f"Invalid {self.network} address format")
+        if not valid:
+            raise ValueError(f"Invalid {network} address format")
 
     def _validate_ethereum_address(self) -> bool:
         """Validate Ethereum address format"""
@@ -63,7 +64,7 @@ class Wallet:
         """Validate Bitcoin address format"""
         return 26 <= len(self.wallet_address) <= 35
 
-    def _generate_checksum(self):
-        """Generate address checksum for integrity"""
-        self._address_checksum = (hashlib.sha256(f"{self.user_id}:{self.network}:{self.wallet_address}".encode())
-                                  .hexdigest())
+    @property
+    def _address_checksum(self) -> str:
+        """Address checksum for integrity, computed on access rather than on every load"""
+        return hashlib.sha256(f"{self.user_id}:{self.network}:{self.wallet_address}".encode()).hexdigest()
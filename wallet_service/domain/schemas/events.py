@@ -1,7 +1,10 @@
 from datetime import datetime
 
+import orjson
 from pydantic import BaseModel, Field
 
+_EVENT_TYPE_HEADER = ("event_type", b"wallet.created")
+
 
 class UserVerifiedEvent(BaseModel):
     """Incoming event schema"""
@@ -25,9 +28,9 @@ class WalletCreatedEvent(BaseModel):
         """Convert to Kafka message format"""
         return {
             "key": f"{self.user_id}:{self.network}".encode(),
-            "value": self.model_dump_json().encode("utf-8"),
+            "value": orjson.dumps(self.model_dump()),
             "headers": [
-                ("event_type", b"wallet.created"),
+                _EVENT_TYPE_HEADER,
                 ("timestamp", str(self.timestamp.timestamp()).encode()),
                 ("network", self.network.encode())
             ]
@@ -10,13 +10,11 @@ class BaseWalletGenerator(IWalletGenerator):
 
     def __init__(self, base_derivation_path: str):
         self.base_derivation_path = base_derivation_path
-        self._path_cache = {}
 
     def get_derivation_path(self, index: int) -> str:
-        """Get cached derivation path"""
-        if index not in self._path_cache:
-            self._path_cache[index] = f"{self.base_derivation_path}/{index}"
-        return self._path_cache[index]
+        """Get derivation path"""
+        # Every wallet gets a fresh index, so a per-index cache would never hit and only grow
+        return f"{self.base_derivation_path}/{index}"
 
     async def generate(self, mnemonic: str, user_id: str, derivation_index: int) -> str:
         """Template method for wallet generation"""
@@ -33,6 +31,5 @@ class BaseWalletGenerator(IWalletGenerator):
         """Derive seed with user-specific salt for security"""
         passphrase = f"wallet-service:{user_id}"
 
-        loop = asyncio.get_event_loop()
-        seed = await loop.run_in_executor(None, Mnemonic.to_seed, mnemonic, passphrase)
+        seed = await asyncio.to_thread(Mnemonic.to_seed, mnemonic, passphrase)
         return seed
@@ -1,29 +1,34 @@
 import asyncio
+from concurrent.futures import Executor
 
 from bitcoinlib.keys import HDKey
 
 from wallet_service.core.base import CryptoConfigs
 from wallet_service.infrastructure.crypto.generators.base import BaseWalletGenerator
 
+_VALID_CHARS = frozenset(CryptoConfigs.valid_chars)
+
+
+def _derive_address(seed: bytes, path: str) -> str:
+    """Derive the address at path; module level so a process pool can pickle it"""
+    hd_key = HDKey.from_seed(seed)
+    child_key = hd_key.derive_path(path)
+    return child_key.address()
+
 
 class BitcoinWalletGenerator(BaseWalletGenerator):
     """Bitcoin wallet generator using bitcoinlib"""
 
-    def __init__(self):
+    def __init__(self, executor: Executor | None = None):
         super().__init__("m/44'/0'/0'/0")
+        self._executor = executor
 
     async def generate_address(self, seed: bytes, path: str) -> str:
         """Generate Bitcoin address"""
-        loop = asyncio.get_event_loop()
-
-        def generate():
-            hd_key = HDKey.from_seed(seed)
-            child_key = hd_key.derive_path(path)
-            address = child_key.address()
-
-            return address
+        loop = asyncio.get_running_loop()
 
-        address = await loop.run_in_executor(None, generate)
+        # HDKey derivation holds the GIL, so the default thread pool cannot run derivations in parallel
+        address = await loop.run_in_executor(self._executor, _derive_address, seed, path)
         return address
 
     async def validate_address(self, address: str) -> bool:
@@ -31,5 +36,4 @@ class BitcoinWalletGenerator(BaseWalletGenerator):
         if len(address) < 26 or len(address) > 35:
             return False
 
-        valid_chars = CryptoConfigs.valid_chars
-        return all(c in valid_chars for c in address)
+        return _VALID_CHARS.issuperset(address)
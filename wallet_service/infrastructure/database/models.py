@@ -1,7 +1,7 @@
 from datetime import datetime
 from uuid import uuid4
 
-from sqlalchemy import Column, DateTime, Integer, String
+from sqlalchemy import Column, DateTime, Integer, String, UniqueConstraint
 from sqlalchemy.dialects.postgresql import UUID as PGUUID
 from sqlalchemy.ext.declarative import declarative_base
 
@@ -11,6 +11,7 @@ Base = declarative_base()
 class WalletModel(Base):
     """Wallet database model."""
     __tablename__ = "wallets"
+    __table_args__ = (UniqueConstraint("user_id", "network", name="uq_wallets_user_id_network"),)
 
     id = Column(PGUUID(as_uuid=True), primary_key=True, default=uuid4)
     user_id = Column(String, nullable=False, index=True)
@@ -18,5 +19,5 @@ class WalletModel(Base):
     wallet_address = Column(String, nullable=False, unique=True)
     derivation_index = Column(Integer, nullable=False)
     created_at = Column(DateTime, nullable=False, default=datetime.now)
-    last_accessed_at = Column(DateTime, nullable=True)
+    last_accessed_at = Column(DateTime(timezone=True), nullable=True)
     version = Column(Integer, nullable=False, default=1)
@@ -1,21 +1,58 @@
 from sqlalchemy import text
-from wallet_service.core.config import Settings
+from wallet_service.core.config import get_settings
 from wallet_service.infrastructure.database.connection import DatabaseConnection
 from wallet_service.infrastructure.database.models import Base
 
+# create_all never alters an existing table, so tables created by older releases are upgraded in place.
+# Each statement is idempotent and runs on every startup.
+_SCHEMA_UPGRADES = (
+    # Concurrent creations for the same user and network rely on this constraint to keep a single wallet
+    text("""
+        DO $$
+        BEGIN
+            IF NOT EXISTS (
+                SELECT 1 FROM pg_constraint
+                WHERE conname = 'uq_wallets_user_id_network'
+                  AND conrelid = 'wallets'::regclass
+            ) THEN
+                ALTER TABLE wallets ADD CONSTRAINT uq_wallets_user_id_network UNIQUE (user_id, network);
+            END IF;
+        END $$
+    """),
+    # Access timestamps used to be written as naive local time, which is UTC in the deployed containers
+    text("""
+        DO $$
+        BEGIN
+            IF EXISTS (
+                SELECT 1 FROM information_schema.columns
+                WHERE table_schema = current_schema()
+                  AND table_name = 'wallets'
+                  AND column_name = 'last_accessed_at'
+                  AND data_type = 'timestamp without time zone'
+            ) THEN
+                ALTER TABLE wallets
+                    ALTER COLUMN last_accessed_at TYPE TIMESTAMP WITH TIME ZONE
+                    USING last_accessed_at AT TIME ZONE 'UTC';
+            END IF;
+        END $$
+    """),
+)
+
 
 async def create_database_tables() -> None:
-    """Create wallet service tables on startup."""
-    settings = Settings()
+    """Create wallet service tables on startup and upgrade ones created by older releases."""
+    settings = get_settings()
     db_connection = DatabaseConnection(settings)
 
     async with db_connection.engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
+        for statement in _SCHEMA_UPGRADES:
+            await conn.execute(statement)
 
 
 async def perform_startup_checks() -> None:
     """Run a simple query to ensure DB is reachable."""
-    settings = Settings()
+    settings = get_settings()
     db_connection = DatabaseConnection(settings)
 
     async with db_connection.get_session() as session:
@@ -1,7 +1,7 @@
-from datetime import datetime
+from datetime import UTC, datetime
 from uuid import UUID
 
-from sqlalchemy import and_, func, select, update
+from sqlalchemy import and_, func, literal, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 from wallet_service.domain.interfaces.wallet_repository import IWalletRepository
 from wallet_service.domain.models.wallet import NetworkType, Wallet
@@ -24,8 +24,10 @@ class WalletRepository(IWalletRepository):
             created_at=wallet.created_at
         )
 
-        self.session.add(db_wallet)
-        await self.session.flush()
+        # Savepoint, so a unique (user_id, network) violation leaves the session usable for re-reading the winner
+        async with self.session.begin_nested():
+            self.session.add(db_wallet)
+            await self.session.flush()
 
         wallet.id = db_wallet.id
         return wallet
@@ -50,26 +52,36 @@ class WalletRepository(IWalletRepository):
 
     async def exists(self, user_id: str, network: str) -> bool:
         """Check if wallet exists."""
-        stmt = select(WalletModel.id).where(
+        stmt = select(literal(1)).where(
             and_(WalletModel.user_id == user_id, WalletModel.network == network)
-        )
+        ).limit(1)
         result = await self.session.execute(stmt)
-        return result.scalar_one_or_none() is not None
+        return result.scalar() is not None
 
     async def update_last_accessed(self, wallet_id: UUID) -> None:
         """Update last accessed timestamp."""
-        stmt = update(WalletModel).where(WalletModel.id == wallet_id).values(last_accessed_at=datetime.now())
+        stmt = update(WalletModel).where(WalletModel.id == wallet_id).values(last_accessed_at=datetime.now(UTC))
         await self.session.execute(stmt)
 
+    async def bulk_update_last_accessed(self, accessed: dict[UUID, datetime]) -> None:
+        """Update last accessed timestamps for many wallets in one executemany."""
+        if not accessed:
+            return
+
+        await self.session.execute(
+            update(WalletModel),
+            [{"id": wallet_id, "last_accessed_at": accessed_at} for wallet_id, accessed_at in accessed.items()]
+        )
+
     def _to_domain(self, db_wallet: WalletModel) -> Wallet:
         """Convert database model to domain model."""
-        wallet = Wallet(
+        # Pass every column up front so the created_at default factory never runs for loaded rows
+        return Wallet(
             user_id=db_wallet.user_id,
             network=NetworkType(db_wallet.network),
             wallet_address=db_wallet.wallet_address,
-            derivation_index=db_wallet.derivation_index
+            derivation_index=db_wallet.derivation_index,
+            id=db_wallet.id,
+            created_at=db_wallet.created_at,
+            last_accessed_at=db_wallet.last_accessed_at
         )
-        wallet.id = db_wallet.id
-        wallet.created_at = db_wallet.created_at
-        wallet.last_accessed_at = db_wallet.last_accessed_at
-        return wallet
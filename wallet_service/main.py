@@ -1,15 +1,17 @@
+import asyncio
 from collections.abc import AsyncIterator
 from contextlib import asynccontextmanager
 from typing import TypedDict
 
 import uvicorn
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 from starlette.requests import Request
 from wallet_service.api.routes import wallet_router
 from wallet_service.api.routes.cache import CacheMiddleware
-from wallet_service.core.config import Settings
+from wallet_service.core.config import Settings, get_settings
 from wallet_service.core.exceptions import MnemonicSecurityException
-from wallet_service.core.logger import Logger
+from wallet_service.core.logger import get_logger
 from wallet_service.core.middleware.error_handler import ErrorHandlerMiddleware
 from wallet_service.core.middleware.request_logger import RequestLoggerMiddleware
 from wallet_service.infrastructure.cache.cache_service import CacheService
@@ -28,7 +30,7 @@ from wallet_service.services.derivation_service import DerivationService
 from wallet_service.services.event_handler import EventHandler
 from wallet_service.services.wallet_service import WalletService
 
-logger = Logger()
+logger = get_logger()
 
 
 class AppState(TypedDict):
@@ -39,12 +41,27 @@ class AppState(TypedDict):
     settings: Settings
 
 
+async def flush_last_accessed_periodically(
+        wallet_service: WalletService,
+        db_connection: DatabaseConnection,
+        interval: int
+) -> None:
+    """Write buffered wallet access timestamps every interval seconds."""
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            async with db_connection.get_session() as session:
+                await wallet_service.flush_last_accessed(WalletRepository(session))
+        except Exception:
+            logger.exception("Failed to flush wallet access timestamps")
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncIterator[None]:
     """Application lifespan manager."""
     logger.info("Starting Wallet Service")
 
-    settings = Settings()
+    settings = get_settings()
 
     if not settings.mnemonic:
         raise MnemonicSecurityException("MNEMONIC environment variable not set")
@@ -72,7 +89,8 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:
         derivation_service=derivation_service,
         cache=cache,
         settings=settings,
-        logger=logger
+        logger=logger,
+        db_connection=db_connection
     )
 
     event_handler = EventHandler(
@@ -91,6 +109,10 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:
     # Start consumer
     await kafka_consumer.start()
 
+    access_flush_task = asyncio.create_task(
+        flush_last_accessed_periodically(wallet_service, db_connection, settings.last_accessed_flush_seconds)
+    )
+
     # Set application state
     app.state.db_connection = db_connection
     app.state.redis_cache = cache
@@ -104,7 +126,18 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:
 
     await app.state.kafka_consumer.stop()
 
+    access_flush_task.cancel()
+    await asyncio.gather(access_flush_task, return_exceptions=True)
+    try:
+        async with db_connection.get_session() as session:
+            await wallet_service.flush_last_accessed(WalletRepository(session))
+    except Exception:
+        # Losing the last access timestamps must not skip closing the producer and the engine below
+        logger.exception("Failed to flush wallet access timestamps on shutdown")
+
+    await wallet_service.wait_for_publishes()
     await kafka_publisher.close()
+    wallet_generator_factory.close()
     await app.state.redis_cache.close()
     await app.state.db_connection.engine.dispose()
 
@@ -120,11 +153,15 @@ def create_application() -> FastAPI:
         title="Wallet Service",
         version="1.0.0",
         lifespan=lifespan,
+        default_response_class=ORJSONResponse,
         docs_url="/api/docs",
         redoc_url="/api/redoc",
         openapi_url="/api/openapi.json"
     )
 
+    # Set by the lifespan once the consumer is running; /health reads it without a hasattr probe
+    app.state.kafka_consumer = None
+
     app.add_middleware(ErrorHandlerMiddleware)
     app.add_middleware(RequestLoggerMiddleware)
 
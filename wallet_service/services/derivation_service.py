@@ -1,4 +1,6 @@
 import asyncio
+import copy
+from collections import defaultdict
 
 from wallet_service.domain.interfaces.wallet_repository import IWalletRepository
 from wallet_service.infrastructure.cache.cache_service import CacheService
@@ -10,20 +12,26 @@ class DerivationService:
     def __init__(self, repository: IWalletRepository, cache: CacheService):
         self.repository = repository
         self.cache = cache
-        self._index_locks = {}
+        self._index_locks: defaultdict[str, asyncio.Lock] = defaultdict(asyncio.Lock)
+
+    def with_repository(self, repository: IWalletRepository) -> "DerivationService":
+        """Bind a session-scoped repository, sharing the per-network index locks with this service."""
+        bound = copy.copy(self)
+        bound.repository = repository
+        return bound
 
     async def get_next_index(self, network: str) -> int:
         """Get next derivation index with caching and locking"""
-        if network not in self._index_locks:
-            self._index_locks[network] = asyncio.Lock()
+        cache_key = f"next_index:{network}"
+        # Read and increment in one step, so the lock is only needed to seed the counter from the repository
+        cached_index = await self.cache.get_and_increment(cache_key)
+        if cached_index is not None:
+            return cached_index
 
         async with self._index_locks[network]:
-            cache_key = f"next_index:{network}"
-            cached_index = await self.cache.get(cache_key)
-
+            # Another task may have seeded the counter while this one waited for the lock
+            cached_index = await self.cache.get_and_increment(cache_key)
             if cached_index is not None:
-                next_index = cached_index + 1
-                await self.cache.set(cache_key, next_index)
                 return cached_index
 
             next_index = await self.repository.get_next_derivation_index(network)
@@ -1,4 +1,4 @@
-import asyncio
+from collections import OrderedDict
 
 from wallet_service.core.config import Settings
 from wallet_service.core.exceptions import WalletAlreadyExistsException
@@ -6,38 +6,46 @@ from wallet_service.core.logger import Logger
 from wallet_service.domain.schemas.events import UserVerifiedEvent
 from wallet_service.services.wallet_service import WalletService
 
+_MAX_PROCESSED_EVENTS = 10000
+
 
 class EventHandler:
     """Handles incoming Kafka events."""
 
-    def __init__(self, wallet_service: WalletService, settings: Settings, logger: Logger):
+    def __init__(
+            self,
+            wallet_service: WalletService,
+            settings: Settings,
+            logger: Logger
+    ):
         self.wallet_service = wallet_service
         self.settings = settings
-        self._processed_events = set()
-        self._event_lock = asyncio.Lock()
+        # Insertion-ordered so the oldest key is evicted in O(1) once the limit is reached
+        self._processed_events: OrderedDict[str, None] = OrderedDict()
         self.logger = logger
 
     async def handle_user_verified(self, event: UserVerifiedEvent) -> None:
         """Handle user.verified event with idempotency."""
         event_key = f"{event.user_id}:{event.network}:{event.timestamp}"
 
-        async with self._event_lock:
-            if event_key in self._processed_events:
-                self.logger.warning(
-                    "Duplicate event detected, skipping",
-                    extra={
-                        "user_id": event.user_id,
-                        "network": event.network
-                    }
-                )
-                return
+        # No await between the check and the insert, so concurrent handlers cannot both pass for the same key
+        if event_key in self._processed_events:
+            self.logger.warning(
+                "Duplicate event detected, skipping",
+                extra={
+                    "user_id": event.user_id,
+                    "network": event.network
+                }
+            )
+            return
 
-            self._processed_events.add(event_key)
+        self._processed_events[event_key] = None
 
-            if len(self._processed_events) > 10000:
-                self._processed_events = set(list(self._processed_events)[-5000:])
+        if len(self._processed_events) > _MAX_PROCESSED_EVENTS:
+            self._processed_events.popitem(last=False)
 
         try:
+            # create_wallet runs on its own session, so concurrently handled events never share one
             wallet = await self.wallet_service.create_wallet(user_id=event.user_id, network=event.network)
 
             self.logger.info(
@@ -66,6 +74,5 @@ class EventHandler:
                 },
                 exc_info=True
             )
-            async with self._event_lock:
-                self._processed_events.discard(event_key)
+            self._processed_events.pop(event_key, None)
             raise
@@ -1,7 +1,12 @@
 import asyncio
+import copy
+from datetime import UTC, datetime
+from functools import partial
+from uuid import UUID
 
+from sqlalchemy.exc import IntegrityError
 from wallet_service.core.config import Settings
-from wallet_service.core.exceptions import WalletGenerationException
+from wallet_service.core.exceptions import InvalidNetworkException, WalletGenerationException
 from wallet_service.core.logger import Logger
 from wallet_service.domain.interfaces.event_publisher import IEventPublisher
 from wallet_service.domain.interfaces.wallet_repository import IWalletRepository
@@ -9,6 +14,8 @@ from wallet_service.domain.models.wallet import NetworkType, Wallet
 from wallet_service.domain.schemas.events import WalletCreatedEvent
 from wallet_service.infrastructure.cache.cache_service import CacheService
 from wallet_service.infrastructure.crypto.wallet_factory import WalletGeneratorFactory
+from wallet_service.infrastructure.database.connection import DatabaseConnection
+from wallet_service.infrastructure.repositories.wallet_repository import WalletRepository
 from wallet_service.services.derivation_service import DerivationService
 
 
@@ -23,20 +30,68 @@ class WalletService:
             derivation_service: DerivationService,
             cache: CacheService,
             settings: Settings,
-            logger: Logger
+            logger: Logger,
+            db_connection: DatabaseConnection
     ):
         self.repository = repository
+        self.db_connection = db_connection
         self.generator_factory = generator_factory
         self.event_publisher = event_publisher
         self.derivation_service = derivation_service
         self.cache = cache
         self.settings = settings
         self.logger = logger
-        self._generation_semaphore = asyncio.Semaphore(settings.max_concurrent_generations)
+        # One limit per network so a backlog of slow derivations on one chain does not starve the others
+        self._generation_semaphores = {
+            network: asyncio.Semaphore(settings.max_concurrent_generations) for network in NetworkType
+        }
+        # The generator set is fixed, so resolve one per network up front instead of per wallet
+        self._generators = {network: generator_factory.get_generator(network) for network in NetworkType}
+        # Read timestamps are buffered and written in bulk by flush_last_accessed instead of one UPDATE per read
+        self._access_buffer: dict[UUID, datetime] = {}
+        self._publish_tasks: set[asyncio.Task] = set()
+        self._inflight: dict[tuple[str, str], asyncio.Task] = {}
+
+    def with_repository(self, repository: IWalletRepository) -> "WalletService":
+        """Bind a session-scoped repository, sharing the generation limits and caches with this service."""
+        bound = copy.copy(self)
+        bound.repository = repository
+        bound.derivation_service = self.derivation_service.with_repository(repository)
+        return bound
 
     async def create_wallet(self, user_id: str, network: str) -> Wallet:
+        """Create wallet, joining an in-flight creation for the same user and network if there is one."""
+        network = network.lower()
+        key = (user_id, network)
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.create_task(self._create_wallet_in_session(user_id, network))
+            self._inflight[key] = task
+            task.add_done_callback(partial(self._on_inflight_done, key))
+
+        # Shielded so a cancelled caller does not cancel the creation other callers are waiting on
+        return await asyncio.shield(task)
+
+    def _on_inflight_done(self, key: tuple[str, str], task: asyncio.Task) -> None:
+        """Forget a finished creation, retrieving its failure in case every waiter was cancelled."""
+        self._inflight.pop(key, None)
+        if not task.cancelled():
+            task.exception()
+
+    async def _create_wallet_in_session(self, user_id: str, network: str) -> Wallet:
+        """Run a shared creation on a session the task owns, so it outlives any single caller."""
+        async with self.db_connection.get_session() as session:
+            return await self.with_repository(WalletRepository(session))._create_wallet(user_id, network)
+
+    async def _create_wallet(self, user_id: str, network: str) -> Wallet:
         """Create wallet with idempotency and caching."""
-        async with self._generation_semaphore:
+        try:
+            semaphore = self._generation_semaphores[NetworkType(network.lower())]
+        except ValueError:
+            msg = f"Unsupported network: {network}"
+            raise InvalidNetworkException(msg) from None
+
+        async with semaphore:
             cache_key = f"wallet:{user_id}:{network}"
             cached_wallet = await self.cache.get(cache_key)
 
@@ -63,10 +118,31 @@ class WalletService:
 
                 await self.cache.set(cache_key, wallet)
 
-                asyncio.create_task(self._publish_wallet_created(wallet))
+                # Keep a strong reference so the publish task is not garbage collected mid-flight
+                publish_task = asyncio.create_task(self._publish_wallet_created(wallet))
+                self._publish_tasks.add(publish_task)
+                publish_task.add_done_callback(self._publish_tasks.discard)
 
                 return wallet
 
+            except IntegrityError as e:
+                # Another worker may have inserted this wallet first; the unique constraint makes theirs the wallet
+                existing = await self.repository.get_by_user_and_network(user_id, network)
+                if existing is None:
+                    # Some other constraint failed, e.g. a duplicate address, so there is no wallet to fall back to
+                    self.logger.error(
+                        f"Failed to create wallet: {e}",
+                        extra={
+                            "user_id": user_id,
+                            "network": network
+                        },
+                        exc_info=True
+                    )
+                    raise WalletGenerationException(f"Failed to generate wallet: {e!s}") from e
+
+                await self.cache.set(cache_key, existing)
+                return existing
+
             except Exception as e:
                 self.logger.error(
                     f"Failed to create wallet: {e}",
@@ -82,7 +158,7 @@ class WalletService:
         """Generate wallet address using appropriate generator."""
         network_type = NetworkType(network.lower())
 
-        generator = self.generator_factory.get_generator(network_type)
+        generator = self._generators[network_type]
 
         derivation_index = await self.derivation_service.get_next_index(network)
 
@@ -96,8 +172,6 @@ class WalletService:
             )
         finally:
             mnemonic = None
-            import gc
-            gc.collect()
 
         wallet = Wallet(
             user_id=user_id,
@@ -114,17 +188,35 @@ class WalletService:
         cached_wallet = await self.cache.get(cache_key)
 
         if cached_wallet:
-            asyncio.create_task(self.repository.update_last_accessed(cached_wallet.id))
+            self._access_buffer[cached_wallet.id] = datetime.now(UTC)
             return cached_wallet
 
         wallet = await self.repository.get_by_user_and_network(user_id, network)
 
         if wallet:
             await self.cache.set(cache_key, wallet)
-            await self.repository.update_last_accessed(wallet.id)
+            self._access_buffer[wallet.id] = datetime.now(UTC)
 
         return wallet
 
+    async def flush_last_accessed(self, repository: IWalletRepository) -> None:
+        """Persist buffered access timestamps through a session-scoped repository."""
+        if not self._access_buffer:
+            return
+
+        accessed, self._access_buffer = self._access_buffer, {}
+        try:
+            await repository.bulk_update_last_accessed(accessed)
+        except Exception:
+            # Put the unwritten timestamps back for the next flush, keeping any newer reads recorded meanwhile
+            accessed.update(self._access_buffer)
+            self._access_buffer = accessed
+            raise
+
+    async def wait_for_publishes(self) -> None:
+        """Wait for in-flight wallet.created publishes, e.g. before closing the producer."""
+        await asyncio.gather(*self._publish_tasks, return_exceptions=True)
+
     async def _publish_wallet_created(self, wallet: Wallet) -> None:
         """Publish wallet created event with retry"""
         event = WalletCreatedEvent(